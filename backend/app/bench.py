@@ -0,0 +1,102 @@
+"""
+Measures per-request CPU time of every GET route, served two ways.
+
+    python -m app.bench [--iterations 500] [--match blog]
+
+"payload" is the route as it is: its handler sends prebuilt bytes. "validated"
+is the same route made to return the decoded content as plain data, so
+FastAPI validates it against the route's response_model and encodes it on
+every call, the way routes that return dicts and lists work. Both run through
+the real FastAPI route handler, without the HTTP stack, and are timed with
+process CPU time after one warm-up call (which also builds any lazy index).
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import sys
+import time
+from typing import Any, List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.routing import APIRoute
+
+from app.export import expand, exportable_routes
+from app.main import app
+from app.routers.batch import resolve
+
+# Routes that need query parameters, benchmarked with a typical request.
+SAMPLE_PATHS = {"GET /api/blog/search": ["/api/blog/search?q=datapower+oauth"]}
+
+BASE_SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "scheme": "http",
+    "server": ("bench", 80),
+    "root_path": "",
+    "path": "/",
+    "query_string": b"",
+    "headers": [],
+    "app": app,
+}
+
+
+def validated_clone(route: APIRoute, content: Any) -> APIRoute:
+    """The route with an endpoint that returns content as data instead of bytes."""
+
+    def endpoint(**kwargs):
+        return content
+
+    endpoint.__signature__ = inspect.signature(route.endpoint)
+    return APIRoute(route.path, endpoint, response_model=route.response_model, methods=["GET"])
+
+
+async def cpu_per_request(route: APIRoute, scope: dict, iterations: int) -> Tuple[float, Any]:
+    handler = route.get_route_handler()
+    response = await handler(Request(scope))
+    start = time.process_time()
+    for _ in range(iterations):
+        await handler(Request(scope))
+    return (time.process_time() - start) / iterations * 1e6, response
+
+
+def bench_paths(match: Optional[str]) -> List[str]:
+    routes, live = exportable_routes()
+    paths = [path for route in routes for path in expand(route.path)]
+    paths += [path for request in live for path in SAMPLE_PATHS.get(request, [])]
+    return [path for path in paths if not match or match in path]
+
+
+async def run(iterations: int, match: Optional[str]) -> List[tuple]:
+    base = Request(BASE_SCOPE)
+    rows = []
+    for path in bench_paths(match):
+        route, scope = resolve(base, path)
+        payload_us, response = await cpu_per_request(route, scope, iterations)
+        validated_us = None
+        if getattr(response, "media_type", None) == "application/json" and hasattr(response, "body"):
+            clone = validated_clone(route, json.loads(response.body))
+            validated_us, _ = await cpu_per_request(clone, scope, iterations)
+        rows.append((path, validated_us, payload_us))
+    return rows
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--iterations", type=int, default=500, help="timed calls per route")
+    parser.add_argument("--match", help="only routes whose path contains this")
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(run(args.iterations, args.match))
+    width = max((len(path) for path, _, _ in rows), default=4)
+    print(f"{'path':<{width}}  {'validated µs':>12}  {'payload µs':>10}  {'speedup':>7}")
+    for path, validated_us, payload_us in rows:
+        if validated_us is None:
+            print(f"{path:<{width}}  {'-':>12}  {payload_us:>10.1f}  {'-':>7}")
+        else:
+            print(f"{path:<{width}}  {validated_us:>12.1f}  {payload_us:>10.1f}  {validated_us / payload_us:>6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
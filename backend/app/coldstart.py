@@ -0,0 +1,203 @@
+"""
+Reports what a cold start costs and checks it against a budget.
+
+    python -m app.coldstart [--top 15] [--budget-ms 1500]
+
+Each measurement runs in a fresh interpreter, as a serverless cold start
+would: the import time of `app.main` per module (from python -X importtime),
+the memory each module allocates while importing (tracemalloc), and the time
+until /health and the first request to each router prefix answer. With
+--budget-ms the command exits non-zero when importing app.main and answering
+/health takes longer, so CI can catch a regression.
+
+It first mounts every router and exits non-zero on a DatasetError. Lazily
+mounted routers only validate their data on first use, so this is the
+check to run before a deploy.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Requested in order by the probe, each one the first to reach its router.
+FIRST_REQUESTS = [
+    "/health",
+    "/api/profile/summary",
+    "/api/certifications/",
+    "/api/blog/",
+    "/api/bootstrap/",
+]
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_DIR)}
+    return subprocess.run(
+        [sys.executable, *args], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True,
+    )
+
+
+def import_times() -> List[Tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) for everything `import app.main` loads."""
+    stderr = run_python("-X", "importtime", "-c", "import app.main").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def package_of(module: str) -> str:
+    # The app's own modules are reported one by one, everything else by
+    # top-level package.
+    return module if module.startswith("app.") else module.split(".")[0]
+
+
+def module_for_file(filename: str, roots: List[str]) -> str:
+    if filename.startswith("<frozen "):
+        # Import machinery and frozen stdlib modules, e.g. "<frozen abc>".
+        return filename[len("<frozen "):-1]
+    for root in roots:
+        if filename.startswith(root + os.sep):
+            parts = Path(filename[len(root) + 1:]).with_suffix("").parts
+            if parts and parts[-1] == "__init__":
+                parts = parts[:-1]
+            return ".".join(parts)
+    return filename
+
+
+def probe() -> dict:
+    """Runs inside the fresh interpreter: import app.main, then time first requests."""
+    import tracemalloc
+
+    tracemalloc.start()
+    from app.main import app
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    roots = sorted((p for p in sys.path if p), key=len, reverse=True)
+    memory: Counter = Counter()
+    for stat in snapshot.statistics("filename"):
+        module = module_for_file(stat.traceback[0].filename, roots)
+        memory[package_of(module)] += stat.size
+
+    # Timed only once tracemalloc is off, as it slows everything down.
+    requests = []
+    for path in FIRST_REQUESTS:
+        start = time.perf_counter()
+        status = asyncio.run(get(app, path))
+        requests.append((path, status, (time.perf_counter() - start) * 1000))
+    return {"memory": memory.most_common(), "requests": requests}
+
+
+def dataset_errors() -> str:
+    """Mounts every router in a fresh process; returns its DatasetError, if any."""
+    code = (
+        "from app.core.datasets import DatasetError\n"
+        "from app.main import app\n"
+        "try:\n"
+        "    app.state.routers.ensure_all()\n"
+        "except DatasetError as e:\n"
+        "    print(e)\n"
+    )
+    return run_python("-c", code).stdout.strip()
+
+
+def cold_start_ms() -> Tuple[float, float]:
+    """Import time of app.main and time to answer /health, in a fresh process."""
+    code = (
+        "import asyncio, json, time\n"
+        "start = time.perf_counter()\n"
+        "from app.main import app\n"
+        "imported = time.perf_counter()\n"
+        "from app.coldstart import get\n"
+        "asyncio.run(get(app, '/health'))\n"
+        "print(json.dumps([(imported - start) * 1000, (time.perf_counter() - imported) * 1000]))\n"
+    )
+    import_ms, health_ms = json.loads(run_python("-c", code).stdout)
+    return import_ms, health_ms
+
+
+async def get(app, path: str) -> int:
+    """Sends one GET straight to the ASGI app and returns its status code."""
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("coldstart", 80),
+        "client": ("127.0.0.1", 0),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+    }
+    statuses = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    await app(scope, receive, send)
+    return statuses[0]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument("--budget-ms", type=float, help="fail if import + /health takes longer")
+    parser.add_argument("--probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.probe:
+        print(json.dumps(probe()))
+        return 0
+
+    errors = dataset_errors()
+    if errors:
+        print(f"Dataset check failed:\n{errors}", file=sys.stderr)
+        return 1
+
+    times = import_times()
+    by_package: Dict[str, int] = Counter()
+    for module, self_us, _ in times:
+        by_package[package_of(module)] += self_us
+    print(f"Import time by package (self, of {sum(by_package.values()) / 1000:.1f} ms):")
+    for package, us in by_package.most_common(args.top):
+        print(f"  {package:<40} {us / 1000:>8.1f} ms")
+
+    result = json.loads(run_python("-m", "app.coldstart", "--probe").stdout)
+    total = sum(size for _, size in result["memory"])
+    print(f"\nMemory allocated while importing (of {total / 1024:.0f} KiB):")
+    for package, size in result["memory"][:args.top]:
+        print(f"  {package:<40} {size / 1024:>8.0f} KiB")
+
+    print("\nFirst request per router (lazy mount included):")
+    for path, status, ms in result["requests"]:
+        print(f"  {path:<40} {status:>4} {ms:>8.1f} ms")
+
+    import_ms, health_ms = cold_start_ms()
+    cold_ms = import_ms + health_ms
+    print(f"\nCold start: import {import_ms:.1f} ms + /health {health_ms:.1f} ms = {cold_ms:.1f} ms")
+    if args.budget_ms is not None and cold_ms > args.budget_ms:
+        print(f"Over budget: {cold_ms:.1f} ms > {args.budget_ms:.0f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
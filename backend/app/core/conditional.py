@@ -0,0 +1,55 @@
+import hashlib
+import re
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Compressed variants of a payload carry its ETag with an encoding suffix.
+_VARIANT_SUFFIX = re.compile(r'-(?:br|gzip)"$')
+
+
+def http_date(value: datetime) -> str:
+    return format_datetime(value, usegmt=True)
+
+
+def etag_of(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def variant_etag(etag: str, encoding: Optional[str]) -> str:
+    return etag if encoding is None else etag[:-1] + "-" + encoding + '"'
+
+
+def base_etag(etag: str) -> str:
+    return _VARIANT_SUFFIX.sub('"', etag.strip().removeprefix("W/"))
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[str]) -> bool:
+    """
+    RFC 9110 evaluation: If-None-Match wins and If-Modified-Since is only
+    used without it. Any encoding of the same payload counts as a match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        return base_etag(etag) in {base_etag(t) for t in if_none_match.split(",")}
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(etag: str, last_modified: Optional[str], vary: bool = False) -> Response:
+    headers = {"ETag": etag}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    if vary:
+        headers["Vary"] = "Accept-Encoding"
+    return Response(status_code=304, headers=headers)
@@ -0,0 +1,202 @@
+import codecs
+import hashlib
+import json
+import math
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.core.cache import LRUCache
+from app.core.datasets import DatasetError
+from app.core.listing import sort_key
+
+FRONT_MATTER_FENCE = b"---\n"
+# A closing run of #s only counts after a space, so "## Using C#" keeps its #.
+HEADING_RE = re.compile(r"(#{1,6})\s+(.+?)(?:\s+#+)?\s*$")
+WORD_RE = re.compile(r"[A-Za-z0-9][\w'’.-]*")
+WORDS_PER_MINUTE = 200
+
+
+def heading_anchor(title: str, seen: Dict[str, int]) -> str:
+    """GitHub-style anchor for a heading, suffixed -1, -2... when repeated."""
+    anchor = re.sub(r"[^\w\s-]", "", title.lower()).strip()
+    anchor = re.sub(r"\s+", "-", anchor)
+    count = seen.get(anchor, 0)
+    seen[anchor] = count + 1
+    return f"{anchor}-{count}" if count else anchor
+
+
+def heading_tree(headings: List[dict]) -> List[dict]:
+    """Nests a flat, document-ordered heading list under its parent headings."""
+    roots: List[dict] = []
+    stack: List[dict] = []
+    for heading in headings:
+        node = {**heading, "children": []}
+        while stack and stack[-1]["level"] >= node["level"]:
+            stack.pop()
+        (stack[-1]["children"] if stack else roots).append(node)
+        stack.append(node)
+    return roots
+
+
+class ContentStore:
+    """
+    Markdown posts on disk, one <slug>.md file each.
+
+    A post starts with a front matter block between two "---" lines, one
+    "key: value" per line with values written as JSON (which keeps them
+    valid YAML).
+
+    Each file is scanned once at startup, a line at a time, for its front
+    matter and an outline: word count, read time, a content hash and the
+    headings with their byte offsets into the body. Only that metadata is
+    kept. Bodies are read from disk when first asked for and kept in a
+    bounded LRU, so resident memory does not grow with the size of the
+    articles.
+
+    With a schema, each post's front matter (with its slug and read_time)
+    is checked against it before the posts are sorted by it. A file that
+    cannot be scanned or fails the schema raises DatasetError.
+    """
+
+    def __init__(self, directory: Path, cache_size: int = 16, schema: Optional[Any] = None):
+        self.directory = directory
+        self._bodies = LRUCache(maxsize=cache_size)
+        self._locations: Dict[str, Tuple[Path, int]] = {}
+        self.outlines: Dict[str, dict] = {}
+        adapter = TypeAdapter(schema) if schema is not None else None
+        posts = []
+        for path in directory.glob("*.md"):
+            try:
+                meta, offset, outline = self._scan(path)
+                meta["slug"] = path.stem
+                meta["read_time"] = outline["read_time"]
+                if adapter is not None:
+                    adapter.validate_python(meta)
+            except ValidationError as e:
+                raise DatasetError(f"{path.name} front matter does not match its schema:\n{e}") from e
+            except ValueError as e:  # includes bad JSON and UTF-8
+                raise DatasetError(f"{path.name}: {e}") from e
+            self._locations[path.stem] = (path, offset)
+            self.outlines[path.stem] = outline
+            posts.append(meta)
+        try:
+            self.posts: List[dict] = sorted(posts, key=sort_key)
+        except (KeyError, ValueError) as e:
+            raise DatasetError(f"posts in {directory.name} cannot be sorted by date: {e!r}") from e
+
+    @staticmethod
+    def _scan(path: Path) -> Tuple[dict, int, dict]:
+        meta = {}
+        with open(path, "rb") as f:
+            if f.readline() != FRONT_MATTER_FENCE:
+                raise ValueError("missing front matter")
+            for line in f:
+                if line == FRONT_MATTER_FENCE:
+                    break
+                key, _, value = line.decode("utf-8").partition(":")
+                meta[key.strip()] = json.loads(value)
+            else:
+                raise ValueError("unterminated front matter")
+            body_offset = f.tell()
+
+            # Offsets are in bytes from the start of the body, so a section
+            # can later be read with a seek instead of re-parsing the post.
+            words, position, in_code, raw = 0, 0, False, b""
+            digest = hashlib.sha256()
+            headings: List[dict] = []
+            anchors: Dict[str, int] = {}
+            for raw in f:
+                line = raw.decode("utf-8")
+                words += len(WORD_RE.findall(line))
+                if line.lstrip().startswith("```"):
+                    in_code = not in_code
+                elif not in_code:
+                    match = HEADING_RE.match(line)
+                    if match:
+                        title = match.group(2)
+                        headings.append({
+                            "level": len(match.group(1)),
+                            "title": title,
+                            "anchor": heading_anchor(title, anchors),
+                            "offset": position,
+                        })
+                position += len(raw)
+                digest.update(raw)
+
+        # A newline ending the file is not part of the body.
+        length = position - 1 if raw.endswith(b"\n") else position
+        for i, heading in enumerate(headings):
+            heading["end"] = next(
+                (h["offset"] for h in headings[i + 1:] if h["level"] <= heading["level"]),
+                length,
+            )
+
+        # Sections split the body at every top-level (# or ##) heading, with
+        # any text before the first one as a section of its own.
+        starts = [h for h in headings if h["level"] <= 2]
+        sections = []
+        if not starts or starts[0]["offset"] > 0:
+            sections.append({"title": None, "anchor": None, "offset": 0,
+                             "end": starts[0]["offset"] if starts else length})
+        sections += [
+            {"title": h["title"], "anchor": h["anchor"], "offset": h["offset"], "end": h["end"]}
+            for h in starts
+        ]
+        outline = {
+            "word_count": words,
+            "read_time": max(1, math.ceil(words / WORDS_PER_MINUTE)),
+            "length": length,
+            "hash": digest.hexdigest(),
+            "headings": headings,
+            "sections": sections,
+        }
+        return meta, body_offset, outline
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self._locations
+
+    def body(self, slug: str) -> str:
+        """Returns the Markdown body of a post, reading it from disk on a cache miss."""
+        return self._bodies.get_or_set(slug, lambda: self._read_body(slug))
+
+    def section(self, slug: str, index: int) -> str:
+        """
+        Returns one section of a post. It is sliced from the cached body when
+        there is one, otherwise only that byte range is read from disk.
+        """
+        section = self.outlines[slug]["sections"][index]
+        body = self._bodies.get(slug)
+        if body is not None:
+            return body.encode("utf-8")[section["offset"]:section["end"]].decode("utf-8")
+        path, offset = self._locations[slug]
+        with open(path, "rb") as f:
+            f.seek(offset + section["offset"])
+            return f.read(section["end"] - section["offset"]).decode("utf-8")
+
+    def iter_body(self, slug: str, chunk_size: int = 16384) -> Iterator[str]:
+        """
+        Yields a post's body in chunks read straight from disk, without
+        loading the whole body or caching it. Chunks never split a character.
+        """
+        path, offset = self._locations[slug]
+        remaining = self.outlines[slug]["length"]
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with open(path, "rb") as f:
+            f.seek(offset)
+            while remaining > 0:
+                data = f.read(min(chunk_size, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                text = decoder.decode(data, final=remaining <= 0)
+                if text:
+                    yield text
+
+    def _read_body(self, slug: str) -> str:
+        path, offset = self._locations[slug]
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return f.read(self.outlines[slug]["length"]).decode("utf-8")
@@ -0,0 +1,92 @@
+import logging
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetError(RuntimeError):
+    """Raised at startup when static data does not match its schema."""
+
+
+class FrozenDict(dict):
+    """A dict that refuses changes, so validated data cannot drift at runtime."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("validated data is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively turns dicts into FrozenDicts and lists into tuples. Both
+    still encode to exactly the same JSON.
+    """
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+# Datasets that were validated when their module was imported, and checks
+# that are too expensive for import time and run once at startup instead.
+VALIDATED: List[str] = []
+STARTUP_CHECKS: Dict[str, Callable[[], None]] = {}
+_passed: set = set()
+_failed: set = set()
+_reported = 0
+
+
+def validated(name: str, schema: Any, data: Any) -> Any:
+    """
+    Validates data against schema (a model, or e.g. List[Model]) and returns
+    the frozen, dumped result for handlers to serve as-is.
+    """
+    adapter = TypeAdapter(schema)
+    try:
+        result = freeze(adapter.dump_python(adapter.validate_python(data)))
+    except ValidationError as e:
+        raise DatasetError(f"{name} does not match its schema:\n{e}") from e
+    VALIDATED.append(name)
+    return result
+
+
+def startup_check(name: str) -> Callable[[Callable[[], None]], Callable[[], None]]:
+    """Registers a function to validate a dataset once, at startup."""
+    def register(check: Callable[[], None]) -> Callable[[], None]:
+        STARTUP_CHECKS[name] = check
+        return check
+    return register
+
+
+def validate_datasets() -> None:
+    """
+    Runs every startup check that has not run yet and raises DatasetError
+    listing all failures, so the app refuses to start rather than serve
+    data that breaks its schema. Safe to call again after more modules have
+    registered checks; a check that failed is not run again.
+    """
+    global _reported
+    errors, checked = [], []
+    for name, check in STARTUP_CHECKS.items():
+        if name in _passed or name in _failed:
+            continue
+        try:
+            check()
+        except ValueError as e:  # includes pydantic's ValidationError
+            _failed.add(name)
+            errors.append(f"{name} does not match its schema:\n{e}")
+        else:
+            _passed.add(name)
+            checked.append(name)
+    if errors:
+        raise DatasetError("\n\n".join(errors))
+    # Only what was validated since the last call, so lazy mounts stay quiet.
+    new = VALIDATED[_reported:] + checked
+    _reported = len(VALIDATED)
+    if new:
+        logger.info("Validated datasets: %s", ", ".join(new))
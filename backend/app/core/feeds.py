@@ -0,0 +1,137 @@
+import hashlib
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from app.core.cache import LRUCache
+from app.core.conditional import http_date
+from app.core.payload import Payload, encode_json
+
+FORMATS = {
+    "rss": "application/rss+xml; charset=utf-8",
+    "atom": "application/atom+xml; charset=utf-8",
+    "json": "application/feed+json",
+}
+
+
+def rfc3339(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FeedBuilder:
+    """
+    Builds RSS 2.0, Atom and JSON Feed documents for a list of entries.
+
+    Each entry is rendered once per (format, slug, version) and kept as a
+    fragment, and each document is cached by a version derived from its
+    entries. When one post changes only that entry is rendered again; the
+    rest of the document is a join of cached fragments. Entries are dicts
+    with slug, title, excerpt, tags, updated (datetime) and version.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        description: str,
+        site_url: str,
+        feed_url: str,
+        author: str,
+        load_html: Callable[[str], str],
+    ):
+        self.title = title
+        self.description = description
+        self.site_url = site_url.rstrip("/")
+        self.feed_url = feed_url.rstrip("/")
+        self.author = author
+        self.load_html = load_html
+        self._fragments = LRUCache(maxsize=1024)
+        self._documents: Dict[Tuple[str, str], Payload] = {}
+
+    def link(self, entry: dict) -> str:
+        return f"{self.site_url}/blog/{entry['slug']}"
+
+    def build(self, format: str, entries: List[dict]) -> Payload:
+        version = hashlib.sha256("".join(e["version"] for e in entries).encode()).hexdigest()
+        key = (format, version)
+        if key not in self._documents:
+            # A new version replaces the previous document of this format.
+            self._documents = {k: v for k, v in self._documents.items() if k[0] != format}
+            fragments = [
+                self._fragments.get_or_set(
+                    (format, e["slug"], e["version"]),
+                    lambda e=e: getattr(self, f"_{format}_entry")(e),
+                )
+                for e in entries
+            ]
+            updated = max((e["updated"] for e in entries), default=None)
+            body = getattr(self, f"_{format}_document")(fragments, updated)
+            payload = Payload(body, media_type=FORMATS[format], last_modified=updated)
+            self._documents[key] = payload.precompress()
+        return self._documents[key]
+
+    def _rss_entry(self, entry: dict) -> bytes:
+        link = escape(self.link(entry))
+        categories = "".join(f"<category>{escape(t)}</category>" for t in entry["tags"])
+        return (
+            f"<item><title>{escape(entry['title'])}</title>"
+            f"<link>{link}</link><guid isPermaLink=\"true\">{link}</guid>"
+            f"<pubDate>{http_date(entry['updated'])}</pubDate>{categories}"
+            f"<description>{escape(self.load_html(entry['slug']))}</description></item>"
+        ).encode("utf-8")
+
+    def _rss_document(self, fragments: List[bytes], updated: datetime) -> bytes:
+        head = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+            f"<title>{escape(self.title)}</title><link>{escape(self.site_url)}/blog</link>"
+            f"<description>{escape(self.description)}</description>"
+            f"<atom:link href={quoteattr(self.feed_url + '/feed.xml')} rel=\"self\" type=\"application/rss+xml\"/>"
+            + (f"<lastBuildDate>{http_date(updated)}</lastBuildDate>" if updated else "")
+        )
+        return head.encode("utf-8") + b"".join(fragments) + b"</channel></rss>"
+
+    def _atom_entry(self, entry: dict) -> bytes:
+        link = self.link(entry)
+        categories = "".join(f"<category term={quoteattr(t)}/>" for t in entry["tags"])
+        return (
+            f"<entry><title>{escape(entry['title'])}</title>"
+            f"<link href={quoteattr(link)}/><id>{escape(link)}</id>"
+            f"<updated>{rfc3339(entry['updated'])}</updated>{categories}"
+            f"<summary>{escape(entry['excerpt'])}</summary>"
+            f"<content type=\"html\">{escape(self.load_html(entry['slug']))}</content></entry>"
+        ).encode("utf-8")
+
+    def _atom_document(self, fragments: List[bytes], updated: datetime) -> bytes:
+        head = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            f"<title>{escape(self.title)}</title><subtitle>{escape(self.description)}</subtitle>"
+            f"<link href={quoteattr(self.site_url + '/blog')}/>"
+            f"<link href={quoteattr(self.feed_url + '/atom.xml')} rel=\"self\"/>"
+            f"<id>{escape(self.site_url)}/blog</id>"
+            f"<author><name>{escape(self.author)}</name></author>"
+            + (f"<updated>{rfc3339(updated)}</updated>" if updated else "")
+        )
+        return head.encode("utf-8") + b"".join(fragments) + b"</feed>"
+
+    def _json_entry(self, entry: dict) -> bytes:
+        return encode_json({
+            "id": self.link(entry),
+            "url": self.link(entry),
+            "title": entry["title"],
+            "summary": entry["excerpt"],
+            "content_html": self.load_html(entry["slug"]),
+            "date_published": rfc3339(entry["updated"]),
+            "tags": entry["tags"],
+        })
+
+    def _json_document(self, fragments: List[bytes], updated: datetime) -> bytes:
+        head = encode_json({
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": self.title,
+            "description": self.description,
+            "home_page_url": self.site_url + "/blog",
+            "feed_url": self.feed_url + "/feed.json",
+            "authors": [{"name": self.author}],
+        })
+        return head[:-1] + b',"items":[' + b",".join(fragments) + b"]}"
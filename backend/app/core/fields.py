@@ -0,0 +1,59 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+
+Projection = Callable[[Any], Any]
+
+
+def parse_fields(fields: str) -> Tuple[str, ...]:
+    """Normalises a fields= value so equivalent field sets share one cache entry."""
+    return tuple(sorted({f.strip() for f in fields.split(",") if f.strip()}))
+
+
+@lru_cache(maxsize=256)
+def compile_projection(fields: Tuple[str, ...]) -> Projection:
+    """
+    Compiles dotted field paths (e.g. "name", "experience.role") into a
+    function that keeps only those fields. Lists are projected element by
+    element, and a path that names a field keeps all of it. Raises
+    ValueError when no field is given or a path names a field the data
+    does not have.
+    """
+    if not fields:
+        raise ValueError("No fields selected")
+    tree: Dict[str, Any] = {}
+    for path in fields:
+        node = tree
+        parts = path.split(".")
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[parts[-1]] = True
+    return _compile(tree, "")
+
+
+def _compile(tree: Dict[str, Any], prefix: str) -> Projection:
+    children = {
+        key: None if sub is True else _compile(sub, f"{prefix}{key}.")
+        for key, sub in tree.items()
+    }
+
+    def project(value: Any) -> Any:
+        if isinstance(value, (list, tuple)):
+            return [project(item) for item in value]
+        if not isinstance(value, dict):
+            raise ValueError(f"Cannot select fields inside {prefix.rstrip('.')}")
+        result = {}
+        # Keep the data's own key order, not the order fields were asked in.
+        for key, item in value.items():
+            if key in children:
+                child = children[key]
+                result[key] = item if child is None else child(item)
+        missing = children.keys() - value.keys()
+        if missing:
+            raise ValueError(f"Unknown field: {prefix}{sorted(missing)[0]}")
+        return result
+
+    return project
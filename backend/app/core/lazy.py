@@ -0,0 +1,86 @@
+import importlib
+import logging
+import threading
+from typing import Dict, List, Tuple
+
+from fastapi import FastAPI
+
+from app.core.datasets import DatasetError, validate_datasets
+
+logger = logging.getLogger(__name__)
+
+# Paths that describe the whole API, so every router has to be mounted first.
+DOCS_PATHS = ("/openapi.json", "/docs", "/redoc")
+
+
+class LazyRouters:
+    """
+    Routers that are imported and mounted the first time a request reaches
+    their prefix, so a cold start only pays for the modules, data and
+    precomputed payloads the request actually needs.
+
+    routers maps a URL prefix to (module name, OpenAPI tags); the module
+    must define `router`. Mounting also runs the dataset checks the module
+    registered, so its data is validated before it is served. A router
+    whose data fails is not mounted and not imported again: every request
+    to its prefix fails with the same DatasetError until a redeploy.
+    """
+
+    def __init__(self, app: FastAPI, routers: Dict[str, Tuple[str, List[str]]]):
+        self.app = app
+        self.routers = routers
+        self.mounted: Dict[str, object] = {}
+        self.failed: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def prefix_for(self, path: str):
+        for prefix in self.routers:
+            if path == prefix or path.startswith(prefix + "/"):
+                return prefix
+        return None
+
+    def ensure(self, path: str) -> None:
+        """Mounts the router serving path, or every router for the docs."""
+        if path in DOCS_PATHS:
+            self.ensure_all()
+            return
+        prefix = self.prefix_for(path)
+        if prefix is not None and prefix not in self.mounted:
+            self.mount(prefix)
+
+    def ensure_all(self) -> None:
+        for prefix in self.routers:
+            if prefix not in self.mounted:
+                self.mount(prefix)
+
+    def mount(self, prefix: str) -> None:
+        with self._lock:
+            if prefix in self.mounted:
+                return
+            if prefix in self.failed:
+                raise DatasetError(self.failed[prefix])
+            module_name, tags = self.routers[prefix]
+            try:
+                module = importlib.import_module(module_name)
+                validate_datasets()
+            except DatasetError as e:
+                self.failed[prefix] = str(e)
+                logger.error("Not mounting %s: %s", prefix, e)
+                raise
+            self.app.include_router(module.router, prefix=prefix, tags=tags)
+            # The cached schema was built without this router's routes.
+            self.app.openapi_schema = None
+            self.mounted[prefix] = module
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that mounts a request's router before routing it."""
+
+    def __init__(self, app, routers: LazyRouters):
+        self.app = app
+        self.routers = routers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            self.routers.ensure(scope["path"])
+        await self.app(scope, receive, send)
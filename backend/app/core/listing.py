@@ -0,0 +1,100 @@
+import base64
+import binascii
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from app.core.payload import encode_json
+
+SortKey = Tuple[int, str]
+
+
+def sort_key(post: dict) -> SortKey:
+    """Newest first, then by slug so posts sharing a date keep a fixed order."""
+    return -int(post["date"].replace("-", "")), post["slug"]
+
+
+def post_date(post: dict) -> datetime:
+    """A post's publication date as a UTC datetime, for Last-Modified."""
+    return datetime.strptime(post["date"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+
+def encode_cursor(key: SortKey) -> str:
+    return base64.urlsafe_b64encode(f"{-key[0]}:{key[1]}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        date, slug = raw.split(":", 1)
+        return -int(date), slug
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+class PostingList:
+    """Sort keys and pre-encoded JSON fragments for one filtered view."""
+
+    def __init__(self):
+        self.keys: List[SortKey] = []
+        self.fragments: List[bytes] = []
+
+    def append(self, key: SortKey, fragment: bytes):
+        self.keys.append(key)
+        self.fragments.append(fragment)
+
+
+class ListingIndex:
+    """
+    Date-ordered posting lists for the blog listing, one for every category
+    and tag plus one for all posts.
+
+    Cursors encode the sort key of the last post on a page rather than an
+    offset, so a page stays the same when posts are added before it, and a
+    page is a bisect plus a slice of already-encoded summaries.
+    """
+
+    def __init__(self, summaries: List[dict]):
+        self.all = PostingList()
+        self.by_category: Dict[str, PostingList] = {}
+        self.by_tag: Dict[str, PostingList] = {}
+        for summary in sorted(summaries, key=sort_key):
+            key, fragment = sort_key(summary), encode_json(summary)
+            self.all.append(key, fragment)
+            self.by_category.setdefault(summary["category"].lower(), PostingList()).append(key, fragment)
+            for tag in summary["tags"]:
+                self.by_tag.setdefault(tag.lower(), PostingList()).append(key, fragment)
+
+    def page(
+        self,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[bytes, Optional[str]]:
+        """Returns one page as a JSON array, plus the cursor for the next one."""
+        empty = PostingList()
+        lists = [self.all]
+        if category is not None:
+            lists.append(self.by_category.get(category.lower(), empty))
+        if tag is not None:
+            lists.append(self.by_tag.get(tag.lower(), empty))
+        postings = min(lists, key=lambda p: len(p.keys))
+        # Both filters at once: walk the shorter list and probe the other.
+        others = [set(p.keys) for p in lists if p is not postings and p is not self.all]
+
+        start = bisect_right(postings.keys, decode_cursor(cursor)) if cursor else 0
+        if others:
+            matches = [
+                i for i in range(start, len(postings.keys))
+                if all(postings.keys[i] in keys for keys in others)
+            ]
+        else:
+            matches = range(start, len(postings.keys))
+
+        selected = matches if limit is None else matches[:limit]
+        body = b"[" + b",".join(postings.fragments[i] for i in selected) + b"]"
+        next_cursor = None
+        if limit is not None and len(matches) > limit:
+            next_cursor = encode_cursor(postings.keys[selected[-1]])
+        return body, next_cursor
@@ -0,0 +1,10 @@
+from markdown_it import MarkdownIt
+
+# CommonMark plus GFM tables. Raw HTML in posts is escaped rather than passed
+# through, and markdown-it already refuses javascript:/vbscript:/data: links,
+# so the output is safe to inject into the page as-is.
+_renderer = MarkdownIt("commonmark", {"html": False}).enable("table")
+
+
+def render_markdown(text: str) -> str:
+    return _renderer.render(text)
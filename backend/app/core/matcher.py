@@ -0,0 +1,85 @@
+from collections import deque
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+def _is_word_char(text: str, i: int) -> bool:
+    return 0 <= i < len(text) and (text[i].isalnum() or text[i] == "_")
+
+
+class Matcher(Generic[K]):
+    """
+    Aho-Corasick automaton for finding many phrases in one pass.
+
+    Patterns are (phrase, key) pairs, matched case-insensitively and only
+    on whole words, with a trailing plural "s"/"es" allowed. Several keys
+    may share a phrase. Building is linear in the total pattern length and
+    scanning is linear in the text length plus the number of matches, no
+    matter how many patterns there are.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, K]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[List[Tuple[int, K]]] = [[]]
+        for phrase, key in patterns:
+            phrase = phrase.lower()
+            if not phrase:
+                continue
+            node = 0
+            for ch in phrase:
+                child = self._goto[node].get(ch)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][ch] = child
+                    self._goto.append({})
+                    self._outputs.append([])
+                node = child
+            self._outputs[node].append((len(phrase), key))
+
+        # Failure links, breadth first so a node's suffix is always done
+        # before the node. Each node also inherits the outputs of its
+        # failure node, since those phrases end wherever it does.
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0) if node else 0
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+                queue.append(child)
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, K]]:
+        """Yields (start, end, key) for every whole-word match, in order of end."""
+        text = text.lower()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, key in outputs[node]:
+                start, end = i + 1 - length, i + 1
+                if _is_word_char(text, start - 1):
+                    continue
+                for suffix in ("", "s", "es"):
+                    if text.startswith(suffix, end) and not _is_word_char(text, end + len(suffix)):
+                        yield start, end, key
+                        break
+
+    def count(self, text: str) -> Dict[K, int]:
+        """
+        Number of matches of each key in text. A match that overlaps an
+        earlier one for the same key (another alias of it) is not counted.
+        """
+        counts: Dict[K, int] = {}
+        last_end: Dict[K, int] = {}
+        for start, end, key in self.find(text):
+            if start < last_end.get(key, 0):
+                continue
+            last_end[key] = end
+            counts[key] = counts.get(key, 0) + 1
+        return counts
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import smtplib
+import ssl
+import time
+from email.message import EmailMessage
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LogSender:
+    """Stands in for SMTP when it is not configured: messages are only logged."""
+
+    def send(self, message: EmailMessage) -> None:
+        logger.info("Contact message (not sent, SMTP not configured): %s", message["Subject"])
+
+    def close(self) -> None:
+        pass
+
+    def is_permanent(self, error: Exception) -> bool:
+        return False
+
+
+class SMTPSender:
+    """
+    Sends over one SMTP connection that is opened on first use and then
+    reused, so a burst of messages pays for one TCP and TLS handshake and
+    one login. A dropped connection is reopened on the next attempt.
+    Blocking; meant to be called from a worker thread.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        use_ssl: bool = False,
+        timeout: float = 10.0,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        context = ssl.create_default_context()
+        if self.use_ssl:
+            smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout, context=context)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if not self.use_ssl:
+                smtp.ehlo()
+                if smtp.has_extn("starttls"):
+                    smtp.starttls(context=context)
+                    smtp.ehlo()
+            if self.user:
+                smtp.login(self.user, self.password or "")
+        except BaseException:
+            smtp.close()
+            raise
+        return smtp
+
+    def send(self, message: EmailMessage) -> None:
+        if self._smtp is None:
+            self._smtp = self._connect()
+        try:
+            self._smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            self._drop()
+            raise
+        except smtplib.SMTPException:
+            # An error reply; the server is still there, so the connection
+            # is kept for the next message. (SMTPException is an OSError.)
+            raise
+        except OSError:
+            self._drop()
+            raise
+
+    def _drop(self) -> None:
+        # The connection is gone; the next attempt opens a new one.
+        smtp, self._smtp = self._smtp, None
+        smtp.close()
+
+    def close(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
+    def is_permanent(self, error: Exception) -> bool:
+        # 5xx replies and refused addresses will fail the same way again.
+        if isinstance(error, (smtplib.SMTPRecipientsRefused, smtplib.SMTPAuthenticationError)):
+            return True
+        return isinstance(error, smtplib.SMTPResponseException) and 500 <= error.smtp_code < 600
+
+
+class Outbox:
+    """
+    In-process queue of outgoing messages, delivered by one background task
+    so requests are acknowledged without waiting on the mail server.
+
+    Failed sends are retried with exponential backoff (backoff, 2*backoff,
+    ... capped at max_backoff) up to retries times, unless the sender calls
+    the error permanent. The sender runs in a thread, one message at a time,
+    and its connection is closed after idle_timeout seconds without mail.
+    The worker starts on the first enqueue, in whatever event loop is
+    running, so nothing has to be started at app startup.
+    """
+
+    def __init__(
+        self,
+        sender,
+        max_size: int = 1000,
+        retries: int = 5,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        idle_timeout: float = 60.0,
+    ):
+        self.sender = sender
+        self.max_size = max_size
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.idle_timeout = idle_timeout
+        self.sent = 0
+        self.failed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def enqueue(self, message: EmailMessage, on_failure: Optional[Callable[[], None]] = None) -> None:
+        """
+        Queues message for delivery; on_failure is called if it is given up
+        on. Raises asyncio.QueueFull when the outbox is full.
+        """
+        self._ensure_worker()
+        self._queue.put_nowait((message, on_failure))
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A new event loop (e.g. a test client per test): carry over any
+            # messages the old loop's worker never got to.
+            pending = []
+            while self._queue is not None and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+            for item in pending:
+                self._queue.put_nowait(item)
+            self._loop, self._task = loop, None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=self.idle_timeout)
+            except asyncio.TimeoutError:
+                await asyncio.to_thread(self.sender.close)
+                continue
+            try:
+                await self._deliver(*item)
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, message: EmailMessage, on_failure: Optional[Callable[[], None]]) -> None:
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                await asyncio.to_thread(self.sender.send, message)
+            except Exception as e:
+                if self.sender.is_permanent(e) or attempt == self.retries:
+                    self.failed += 1
+                    logger.error("Giving up on %r after %d attempts: %s", message["Subject"], attempt + 1, e)
+                    if on_failure is not None:
+                        on_failure()
+                    return
+                delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+                logger.warning("Sending %r failed (%s), retrying in %.1fs", message["Subject"], e, delay)
+                await asyncio.sleep(delay)
+            else:
+                self.sent += 1
+                # LogSender has already logged that nothing was sent.
+                if not isinstance(self.sender, LogSender):
+                    logger.info("Sent %r in %.0f ms", message["Subject"], (time.perf_counter() - start) * 1000)
+                return
+
+    async def join(self) -> None:
+        """Waits until every queued message has been delivered or given up on."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Delivers what is queued (for up to timeout seconds), then stops the worker."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(self.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Closing the outbox with %d messages undelivered", self._queue.qsize())
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await asyncio.to_thread(self.sender.close)
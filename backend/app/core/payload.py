@@ -0,0 +1,145 @@
+import gzip
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from fastapi import Response
+
+from app.core.conditional import etag_of, http_date, variant_etag
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip variants are built
+    brotli = None
+
+# Preferred first when a client accepts several encodings equally.
+ENCODINGS = ("br", "gzip")
+
+
+def encode_json(content: Any) -> bytes:
+    """Encodes content byte-for-byte the way FastAPI's JSONResponse does."""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def encode_json_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """
+    Encodes a string that arrives in pieces as the body of a JSON string,
+    without the quotes. JSON escapes each character on its own, so the joined
+    output is identical to encoding the whole string at once.
+    """
+    for chunk in chunks:
+        yield json.dumps(chunk, ensure_ascii=False)[1:-1].encode("utf-8")
+
+
+def iter_slices(body: bytes, size: int = 16384) -> Iterator[bytes]:
+    view = memoryview(body)
+    for start in range(0, len(body), size):
+        yield bytes(view[start:start + size])
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """Picks the best of the available encodings for an Accept-Encoding header."""
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        params = params.strip()
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 0.0
+        qualities[name.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        if encoding in available:
+            quality = qualities.get(encoding, qualities.get("*", 0.0))
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+    return best
+
+
+class Payload:
+    """A response body encoded once, with its validators, ready to be sent as-is."""
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str = "application/json",
+        last_modified: Optional[datetime] = None,
+    ):
+        self.body = body
+        self.media_type = media_type
+        self.etag = etag_of(body)
+        self.last_modified = http_date(last_modified) if last_modified else None
+        self._variants: Dict[str, bytes] = {}
+        self._compress = False
+
+    @classmethod
+    def json(cls, content: Any, last_modified: Optional[datetime] = None) -> "Payload":
+        return cls(encode_json(content), last_modified=last_modified)
+
+    def precompress(self) -> "Payload":
+        """
+        Adds gzip (and brotli, when installed) variants at maximum
+        compression, keeping only those smaller than the body. Meant for
+        payloads that are built once and served many times.
+
+        The variants are built the first time they are needed rather than
+        here: maximum-quality brotli costs a couple of milliseconds even for
+        a small body, which adds up across the payloads a module builds at
+        import, and a cold start should not pay it for payloads no request
+        asks for.
+        """
+        self._compress = True
+        return self
+
+    @property
+    def variants(self) -> Dict[str, bytes]:
+        """Encoding -> compressed body. Building them twice concurrently is harmless."""
+        if self._compress:
+            variants = {"gzip": gzip.compress(self.body, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                variants["br"] = brotli.compress(self.body, quality=11)
+            self._variants = {e: v for e, v in variants.items() if len(v) < len(self.body)}
+            self._compress = False
+        return self._variants
+
+    def response(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None,
+    ) -> "PayloadResponse":
+        response_headers = {"ETag": variant_etag(self.etag, encoding)}
+        if self.last_modified:
+            response_headers["Last-Modified"] = self.last_modified
+        if self.variants:
+            response_headers["Vary"] = "Accept-Encoding"
+        if encoding is not None:
+            response_headers["Content-Encoding"] = encoding
+        response_headers.update(headers or {})
+        return PayloadResponse(
+            self,
+            headers,
+            content=self.body if encoding is None else self.variants[encoding],
+            media_type=self.media_type,
+            headers=response_headers,
+        )
+
+
+class PayloadResponse(Response):
+    """
+    A response sent from a Payload. It keeps the payload and the handler's
+    extra headers so the route can swap in a precompressed variant.
+    """
+
+    def __init__(self, payload: Payload, extra_headers: Optional[Dict[str, str]], **kwargs):
+        super().__init__(**kwargs)
+        self.payload = payload
+        self.extra_headers = extra_headers
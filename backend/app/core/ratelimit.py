@@ -0,0 +1,122 @@
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+# A bucket is (tokens, updated, full_at): tokens left at time updated, and
+# when it will have refilled to capacity. A full bucket is the same as no
+# bucket at all, so any key past its full_at can be dropped.
+Bucket = Tuple[float, float, float]
+
+
+def take_token(bucket: Optional[Bucket], now: float, rate: float, capacity: float) -> Tuple[Bucket, float]:
+    """
+    Refills bucket at rate tokens per second up to capacity and takes one
+    token. Returns the new bucket and 0, or, when no token is left, the
+    bucket and the seconds until there will be one.
+    """
+    tokens = capacity if bucket is None else min(capacity, bucket[0] + (now - bucket[1]) * rate)
+    wait = 0.0
+    if tokens >= 1:
+        tokens -= 1
+    else:
+        wait = (1 - tokens) / rate
+    return (tokens, now, now + (capacity - tokens) / rate), wait
+
+
+class MemoryBucketStore:
+    """
+    Token buckets for one process, in an LRU of at most max_keys keys.
+
+    Each take is O(1). Keys whose bucket has refilled are evicted from the
+    cold end as new keys arrive, and past max_keys the least recently seen
+    key is dropped even if not yet full, so memory stays bounded when a
+    flood uses many addresses.
+    """
+
+    def __init__(self, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Bucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, capacity: float) -> float:
+        with self._lock:
+            now = self.clock()
+            bucket, wait = take_token(self._buckets.get(key), now, rate, capacity)
+            self._buckets[key] = bucket
+            self._buckets.move_to_end(key)
+            while self._buckets:
+                oldest, (_, _, full_at) = next(iter(self._buckets.items()))
+                if full_at > now and len(self._buckets) <= self.max_keys:
+                    break
+                del self._buckets[oldest]
+            return wait
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SQLiteBucketStore:
+    """
+    Token buckets in a SQLite file, shared by every worker process that
+    opens the same path. Each take is one short write transaction; full
+    buckets are deleted every prune_every takes.
+    """
+
+    def __init__(self, path: str, prune_every: int = 1000, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.prune_every = prune_every
+        self._takes = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL, updated REAL, full_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS buckets_full_at ON buckets (full_at)")
+
+    def take(self, key: str, rate: float, capacity: float) -> float:
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, so two workers cannot
+            # both read the same token count and spend it twice.
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                now = self.clock()
+                row = self._db.execute(
+                    "SELECT tokens, updated, full_at FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                bucket, wait = take_token(row, now, rate, capacity)
+                self._db.execute(
+                    "INSERT INTO buckets (key, tokens, updated, full_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET "
+                    "tokens = excluded.tokens, updated = excluded.updated, full_at = excluded.full_at",
+                    (key, *bucket),
+                )
+                self._takes += 1
+                if self._takes % self.prune_every == 0:
+                    self._db.execute("DELETE FROM buckets WHERE full_at <= ?", (now,))
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            return wait
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM buckets").fetchone()[0]
+
+
+class RateLimit:
+    """capacity requests at once, refilled at capacity per period seconds."""
+
+    def __init__(self, store, capacity: int, period: float):
+        self.store = store
+        self.capacity = capacity
+        self.rate = capacity / period
+
+    def hit(self, key: str) -> int:
+        """Counts a request for key; returns 0, or the whole seconds to wait."""
+        return math.ceil(self.store.take(key, self.rate, self.capacity))
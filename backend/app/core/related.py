@@ -0,0 +1,85 @@
+import math
+from collections import Counter
+from typing import Callable, List, Tuple
+
+from app.core.search import STOPWORDS, TOKEN_RE
+
+# Share of the similarity score that comes from tags rather than text.
+TAG_WEIGHT = 0.3
+
+
+def build_related(
+    docs: List[dict],
+    load_content: Callable[[str], str],
+    k: int = 10,
+    max_features: int = 2048,
+    block_size: int = 256,
+) -> List[List[Tuple[int, float]]]:
+    """
+    Returns, for every doc, its k most similar other docs as (index, score)
+    pairs, best first.
+
+    Similarity is TAG_WEIGHT * tag cosine + (1 - TAG_WEIGHT) * TF-IDF cosine
+    over content. Both parts are folded into one L2-normalised vector per
+    doc, so a single matrix product gives the combined score. Rows are
+    compared block by block and only the top k of each row is kept, so
+    memory is O(n * (features + block_size)) rather than O(n^2).
+    """
+    import numpy as np
+
+    n = len(docs)
+    if n < 2:
+        return [[] for _ in docs]
+
+    term_counts = []
+    df: Counter = Counter()
+    for doc in docs:
+        counts = Counter(TOKEN_RE.findall(load_content(doc["slug"]).lower()))
+        for stopword in STOPWORDS.intersection(counts):
+            del counts[stopword]
+        term_counts.append(counts)
+        df.update(counts.keys())
+    tags = [{t.lower() for t in doc["tags"]} for doc in docs]
+    tag_df = Counter(t for doc_tags in tags for t in doc_tags)
+
+    # Terms found in a single doc, or in every doc, cannot relate two posts.
+    terms = [t for t, c in df.most_common() if 1 < c < n][:max_features]
+    tag_names = [t for t, c in tag_df.most_common() if c > 1][:max_features]
+    term_index = {t: i for i, t in enumerate(terms)}
+    tag_index = {t: i for i, t in enumerate(tag_names)}
+
+    # One row per doc: TF-IDF columns first, then tag columns.
+    idf = {t: math.log(n / df[t]) for t in terms}
+    rows, cols, values = [], [], []
+    for i, counts in enumerate(term_counts):
+        for term in term_index.keys() & counts.keys():
+            rows.append(i)
+            cols.append(term_index[term])
+            values.append((1 + math.log(counts[term])) * idf[term])
+        for tag in tag_index.keys() & tags[i]:
+            rows.append(i)
+            cols.append(len(terms) + tag_index[tag])
+            values.append(1.0)
+    del term_counts
+
+    vectors = np.zeros((n, len(terms) + len(tag_names)), dtype=np.float32)
+    vectors[rows, cols] = values
+    del rows, cols, values
+    for part, weight in ((slice(0, len(terms)), 1 - TAG_WEIGHT), (slice(len(terms), None), TAG_WEIGHT)):
+        norms = np.linalg.norm(vectors[:, part], axis=1, keepdims=True)
+        vectors[:, part] *= math.sqrt(weight) / np.where(norms == 0, 1, norms)
+
+    k = min(k, n - 1)
+    related = []
+    for start in range(0, n, block_size):
+        scores = vectors[start:start + block_size] @ vectors.T
+        rows = np.arange(scores.shape[0])
+        scores[rows, rows + start] = -np.inf
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for row, candidates in enumerate(top):
+            order = candidates[np.argsort(-scores[row, candidates], kind="stable")]
+            related.append([
+                (int(j), round(float(scores[row, j]), 4))
+                for j in order if scores[row, j] > 0
+            ])
+    return related
@@ -0,0 +1,65 @@
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.cache import LRUCache
+from app.core.conditional import etag_of, is_not_modified, not_modified_response, variant_etag
+from app.core.payload import PayloadResponse, negotiate_encoding
+
+# URL -> (ETag, Last-Modified, available encodings) of the last 200 sent for it.
+VALIDATORS = LRUCache(maxsize=1024)
+
+
+class StaticRoute(APIRoute):
+    """
+    Route class for GET endpoints whose responses are static per deploy.
+
+    The validators of the first 200 for a URL are remembered, and later
+    conditional requests for it are answered with 304 Not Modified before
+    dependencies are solved or the endpoint runs. Responses built from a
+    precompressed Payload are sent in the best encoding the client accepts.
+    Responses that arrive without an ETag get one derived from their body.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def static_handler(request: Request) -> Response:
+            if request.method != "GET":
+                return await handler(request)
+
+            accept_encoding = request.headers.get("accept-encoding")
+            key = request.url.path + "?" + request.url.query
+            validators = VALIDATORS.get(key)
+            if validators:
+                etag, last_modified, encodings = validators
+                if is_not_modified(request, etag, last_modified):
+                    encoding = negotiate_encoding(accept_encoding, encodings)
+                    return not_modified_response(variant_etag(etag, encoding), last_modified, bool(encodings))
+
+            response = await handler(request)
+            if response.status_code != 200:
+                return response
+
+            if isinstance(response, PayloadResponse):
+                payload = response.payload
+                encoding = negotiate_encoding(accept_encoding, payload.variants)
+                if encoding is not None:
+                    response = payload.response(response.extra_headers, encoding)
+                validators = (payload.etag, payload.last_modified, tuple(payload.variants))
+            else:
+                etag = response.headers.get("etag")
+                if etag is None and hasattr(response, "body"):
+                    etag = etag_of(response.body)
+                    response.headers["ETag"] = etag
+                if etag is None:
+                    return response
+                validators = (etag, response.headers.get("last-modified"), ())
+
+            VALIDATORS.set(key, validators)
+            if is_not_modified(request, validators[0], validators[1]):
+                return not_modified_response(response.headers["etag"], validators[1], bool(validators[2]))
+            return response
+
+        return static_handler
@@ -0,0 +1,170 @@
+import heapq
+import math
+import re
+from collections import Counter
+from html import escape
+from typing import Callable, Dict, Iterable, List, Tuple
+
+TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how in into is it its "
+    "not of on or so that the their then there these this to was we what "
+    "when which who will with you your".split()
+)
+
+# Matches in the title or tags say far more about a post than one in the body.
+FIELD_BOOSTS = {"title": 3.0, "tags": 2.5, "excerpt": 1.5, "content": 1.0}
+
+SNIPPET_CHARS = 160
+
+
+def tokenize(text: str) -> Iterable[Tuple[str, int]]:
+    """Yields (term, char offset) pairs, lowercased and without stopwords."""
+    for match in TOKEN_RE.finditer(text):
+        term = match.group().lower()
+        if term not in STOPWORDS:
+            yield term, match.start()
+
+
+class SearchIndex:
+    """
+    In-memory BM25F inverted index over blog posts.
+
+    Everything that does not depend on the query (field length
+    normalisation, idf, tf saturation) is folded into a single impact score
+    per posting at build time, so a query only touches the posting lists of
+    its own terms. Postings are sorted by impact so ranking can stop early
+    instead of scoring every post that mentions a term.
+    """
+
+    def __init__(
+        self,
+        docs: List[dict],
+        load_content: Callable[[str], str],
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.docs = docs
+        self.load_content = load_content
+
+        # First pass: raw term frequencies per field, reading one body at a
+        # time so no more than one post's content is held here at once.
+        field_tfs: List[Dict[str, Counter]] = []
+        lengths: Dict[str, List[int]] = {name: [] for name in FIELD_BOOSTS}
+        self.offsets: Dict[str, Dict[int, List[int]]] = {}
+        for doc_id, doc in enumerate(docs):
+            tfs = {}
+            for name in FIELD_BOOSTS:
+                text = load_content(doc["slug"]) if name == "content" else self._field_text(doc, name)
+                tokens = list(tokenize(text))
+                lengths[name].append(len(tokens))
+                tfs[name] = Counter(term for term, _ in tokens)
+                if name == "content":
+                    for term, start in tokens:
+                        self.offsets.setdefault(term, {}).setdefault(doc_id, []).append(start)
+            field_tfs.append(tfs)
+
+        # Second pass: length-normalised, boosted tf summed across fields.
+        avg_len = {name: (sum(ls) / len(ls) if ls else 0) or 1.0 for name, ls in lengths.items()}
+        weighted_tf: Dict[str, Dict[int, float]] = {}
+        for doc_id, tfs in enumerate(field_tfs):
+            for name, boost in FIELD_BOOSTS.items():
+                norm = 1 - b + b * lengths[name][doc_id] / avg_len[name]
+                for term, tf in tfs[name].items():
+                    weighted = weighted_tf.setdefault(term, {})
+                    weighted[doc_id] = weighted.get(doc_id, 0.0) + boost * tf / norm
+
+        n = len(docs)
+        self.postings: Dict[str, List[Tuple[float, int]]] = {}
+        self.impacts: Dict[str, Dict[int, float]] = {}
+        for term, tfs in weighted_tf.items():
+            idf = math.log(1 + (n - len(tfs) + 0.5) / (len(tfs) + 0.5))
+            impacts = {doc_id: idf * tf * (k1 + 1) / (tf + k1) for doc_id, tf in tfs.items()}
+            self.impacts[term] = impacts
+            self.postings[term] = sorted(((s, d) for d, s in impacts.items()), reverse=True)
+
+    @staticmethod
+    def _field_text(doc: dict, name: str) -> str:
+        value = doc.get(name, "")
+        return " ".join(value) if isinstance(value, (list, tuple)) else value
+
+    def search(self, query: str, limit: int = 10) -> List[dict]:
+        terms = [t for t in dict.fromkeys(t for t, _ in tokenize(query)) if t in self.postings]
+        results = []
+        for score, doc_id in self._top(terms, limit):
+            doc = self.docs[doc_id]
+            content = self.load_content(doc["slug"])
+            starts = sorted(s for t in terms for s in self.offsets.get(t, {}).get(doc_id, ()))
+            spans = self._spans(content, starts)
+            results.append({
+                "slug": doc["slug"],
+                "title": doc["title"],
+                "score": round(score, 4),
+                "snippet": self._snippet(doc, content, spans),
+                "offsets": [list(span) for span in spans],
+            })
+        return results
+
+    def _top(self, terms: List[str], limit: int) -> List[Tuple[float, int]]:
+        # Fagin's threshold algorithm: walk the impact-sorted lists in
+        # lockstep and stop once no unseen post can beat the current top k.
+        lists = [self.postings[t] for t in terms]
+        impacts = [self.impacts[t] for t in terms]
+        seen = set()
+        heap: List[Tuple[float, int]] = []
+        depth = 0
+        while True:
+            threshold = 0.0
+            exhausted = True
+            for postings in lists:
+                if depth >= len(postings):
+                    continue
+                exhausted = False
+                impact, doc_id = postings[depth]
+                threshold += impact
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                score = sum(m.get(doc_id, 0.0) for m in impacts)
+                if len(heap) < limit:
+                    heapq.heappush(heap, (score, doc_id))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, doc_id))
+            if exhausted or (len(heap) == limit and heap[0][0] >= threshold):
+                return sorted(heap, reverse=True)
+            depth += 1
+
+    @staticmethod
+    def _spans(content: str, starts: List[int]) -> List[Tuple[int, int]]:
+        # Offsets only record where a term starts; the token found there
+        # gives the end.
+        return [(start, TOKEN_RE.match(content, start).end()) for start in starts]
+
+    @staticmethod
+    def _snippet(doc: dict, content: str, spans: List[Tuple[int, int]]) -> str:
+        if not spans:
+            return escape(doc["excerpt"][:SNIPPET_CHARS])
+
+        # Slide a fixed-size window over the hits and keep the densest one.
+        best, count, j = 0, 0, 0
+        for i, (_, end) in enumerate(spans):
+            while end - spans[j][0] > SNIPPET_CHARS:
+                j += 1
+            if i - j + 1 > count:
+                best, count = j, i - j + 1
+        window_start = max(0, spans[best][0] - SNIPPET_CHARS // 4)
+        window_end = min(len(content), window_start + SNIPPET_CHARS)
+
+        parts = ["…" if window_start else ""]
+        cursor = window_start
+        for start, end in spans:
+            if start < window_start or end > window_end:
+                continue
+            parts.append(escape(content[cursor:start]))
+            parts.append("<mark>" + escape(content[start:end]) + "</mark>")
+            cursor = end
+        parts.append(escape(content[cursor:window_end]))
+        if window_end < len(content):
+            parts.append("…")
+        return "".join(parts)
@@ -0,0 +1,83 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+PAREN_RE = re.compile(r"\s*\(([^)]*)\)")
+
+
+def skill_slug(name: str) -> str:
+    """URL-safe form of a skill name, e.g. "GatewayScript / JS" -> "gatewayscript-js"."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def skill_aliases(name: str, extra: Iterable[str] = ()) -> List[str]:
+    """
+    Every spelling a skill may appear under in experience text: the full
+    name, each part of a "A / B" name, and a name with its parenthetical
+    both with and without it, e.g. "IBM API Connect (APIC)" gives
+    "IBM API Connect" and "APIC". Spellings the name does not give away,
+    like "mTLS" for "Mutual TLS", are passed in as extra.
+    """
+    aliases = [name]
+    bare = PAREN_RE.sub("", name).strip()
+    aliases.append(bare)
+    aliases.extend(PAREN_RE.findall(name))
+    if " / " in bare:
+        aliases.extend(part.strip() for part in bare.split(" / "))
+    aliases.extend(extra)
+    return [a for a in dict.fromkeys(aliases) if a]
+
+
+def alias_pattern(aliases: List[str]) -> re.Pattern:
+    # Longest first so "OAuth 2.0" is preferred over a shorter alias at the
+    # same position; the lookarounds stop "JS" from matching inside "JSON",
+    # while a plural ("Multi-Protocol Gateways") still counts.
+    alternatives = "|".join(re.escape(a) for a in sorted(aliases, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?:e?s)?(?!\w)", re.IGNORECASE)
+
+
+def build_skill_index(
+    skills: List[dict],
+    experience: List[dict],
+    aliases: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, dict]:
+    """
+    Maps each skill's slug to the skill and the experience entries that use
+    it, with the technologies and responsibilities that mention it.
+    aliases maps a skill name to the extra spellings it goes by.
+
+    Technologies are short labels, so they also match the other way round:
+    "IBM DataPower" or "MQ" counts for "IBM DataPower Gateway" and
+    "WebSphere MQ".
+    """
+    technology_patterns = {
+        t: alias_pattern([t]) for job in experience for t in job["technologies"]
+    }
+    index = {}
+    for skill in skills:
+        names = skill_aliases(skill["name"], (aliases or {}).get(skill["name"], ()))
+        pattern = alias_pattern(names)
+        used_in = []
+        for job in experience:
+            technologies = [
+                t for t in job["technologies"]
+                if pattern.search(t) or technology_patterns[t].search(skill["name"])
+            ]
+            responsibilities = [r for r in job["responsibilities"] if pattern.search(r)]
+            if technologies or responsibilities:
+                used_in.append({
+                    "id": job["id"],
+                    "role": job["role"],
+                    "company": job["company"],
+                    "duration": job["duration"],
+                    "technologies": technologies,
+                    "responsibilities": responsibilities,
+                })
+        slug = skill_slug(skill["name"])
+        index[slug] = {
+            "name": skill["name"],
+            "slug": slug,
+            "category": skill["category"],
+            "aliases": names[1:],
+            "experience": used_in,
+        }
+    return index
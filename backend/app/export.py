@@ -0,0 +1,162 @@
+"""
+Prerenders every read-only API endpoint to static files.
+
+    python -m app.export --out dist/static
+
+Each GET route is requested through the real app, and the exact response
+bytes are written for identity, gzip and brotli, alongside a manifest.json
+that maps URL paths to files and headers. Every written file is then
+checked byte-for-byte against a fresh response from the live handlers.
+Only responses without query parameters are exported: routes that need
+one (search) are skipped, routes with optional ones are exported with their
+defaults only, and everything that must stay live is listed, POST routes
+included.
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import blog, profile
+
+PARAM_RE = re.compile(r"{(\w+)}")
+ENCODINGS = ("br", "gzip")
+EXTENSIONS = {
+    "application/json": "json",
+    "application/feed+json": "json",
+    "application/rss+xml": "xml",
+    "application/atom+xml": "xml",
+}
+
+
+def expand(path: str) -> Iterator[str]:
+    """Yields every concrete URL for a route path, filling in known parameters."""
+    params = PARAM_RE.findall(path)
+    if not params:
+        yield path
+    elif params == ["slug"]:
+        for slug in blog.POST_SUMMARIES:
+            yield path.replace("{slug}", slug)
+    elif params == ["name"]:
+        for slug in profile.SKILL_PAYLOADS:
+            yield path.replace("{name}", slug)
+    elif params == ["slug", "n"]:
+        for slug in blog.POST_SUMMARIES:
+            for n in range(len(blog.STORE.outlines[slug]["sections"])):
+                yield path.replace("{slug}", slug).replace("{n}", str(n))
+    else:
+        raise ValueError(f"don't know how to expand {path}")
+
+
+def exportable_routes() -> Tuple[List[APIRoute], List[str]]:
+    """Returns the GET routes to export and what must stay on the live API."""
+    app.state.routers.ensure_all()
+    routes, live = [], []
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        if "GET" not in route.methods:
+            for method in sorted(route.methods):
+                live.append(f"{method} {route.path}")
+            continue
+        params = route.dependant.query_params
+        if any(p.required for p in params):
+            live.append(f"GET {route.path}")
+            continue
+        routes.append(route)
+        if params:
+            # Only the response with every parameter at its default is exported.
+            names = [p.alias for p in params]
+            if len(names) > 1:
+                names[-2:] = [f"{names[-2]} or {names[-1]}"]
+            live.append(f"GET {route.path} with {', '.join(names)}")
+    return routes, live
+
+
+def fetch(client: TestClient, path: str, encoding: str = "identity") -> Tuple[bytes, Dict[str, str]]:
+    with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as response:
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} returned {response.status_code}")
+        return b"".join(response.iter_raw()), dict(response.headers)
+
+
+def file_for(path: str, media_type: str) -> str:
+    # Every URL becomes a directory holding an index file, since /api/blog/x
+    # and /api/blog/x/toc both have to exist.
+    extension = EXTENSIONS.get(media_type.split(";")[0], "bin")
+    directory = path.strip("/")
+    return f"{directory}/index.{extension}" if directory else f"index.{extension}"
+
+
+def export(out: Path) -> Tuple[List[dict], List[str]]:
+    routes, live = exportable_routes()
+    manifest = []
+    # Entering the client runs the app's startup, so invalid data is never exported.
+    with TestClient(app) as client:
+        for route in routes:
+            for path in expand(route.path):
+                body, headers = fetch(client, path)
+                entry = {
+                    "path": path,
+                    "file": file_for(path, headers["content-type"]),
+                    "content_type": headers["content-type"],
+                    "etag": headers.get("etag"),
+                    "last_modified": headers.get("last-modified"),
+                    "variants": {},
+                }
+                (out / entry["file"]).parent.mkdir(parents=True, exist_ok=True)
+                (out / entry["file"]).write_bytes(body)
+                for encoding in ENCODINGS:
+                    encoded, encoded_headers = fetch(client, path, encoding)
+                    if encoded_headers.get("content-encoding") != encoding:
+                        continue
+                    name = f"{entry['file']}.{'br' if encoding == 'br' else 'gz'}"
+                    (out / name).write_bytes(encoded)
+                    entry["variants"][encoding] = {"file": name, "etag": encoded_headers.get("etag")}
+                manifest.append(entry)
+    (out / "manifest.json").write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    return manifest, live
+
+
+def verify(out: Path, manifest: List[dict]) -> List[str]:
+    """Re-requests every exported URL and returns the files that differ."""
+    mismatches = []
+    with TestClient(app) as client:
+        for entry in manifest:
+            files = [("identity", entry["file"])]
+            files += [(encoding, v["file"]) for encoding, v in entry["variants"].items()]
+            for encoding, name in files:
+                if fetch(client, entry["path"], encoding)[0] != (out / name).read_bytes():
+                    mismatches.append(name)
+    return mismatches
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--out", type=Path, default=Path("dist/static"), help="output directory")
+    args = parser.parse_args(argv)
+
+    manifest, live = export(args.out)
+    files = sum(1 + len(e["variants"]) for e in manifest)
+    print(f"Exported {len(manifest)} URLs ({files} files) to {args.out}")
+    print("Must stay live (exported URLs take no query parameters):")
+    for request in live:
+        print(f"  {request}")
+
+    mismatches = verify(args.out, manifest)
+    if mismatches:
+        for name in mismatches:
+            print(f"MISMATCH {name}", file=sys.stderr)
+        return 1
+    print("Verified: every file matches the live response byte-for-byte")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,35 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import profile, contact, certifications, blog
+from app.core.datasets import validate_datasets
+from app.core.lazy import LazyRouterMiddleware, LazyRouters
+import os
+
+# Routers are imported and mounted on the first request to their prefix, so
+# a serverless cold start only loads what that request needs. LAZY_ROUTERS=0
+# mounts them all at startup instead.
+LAZY_ROUTERS = os.getenv("LAZY_ROUTERS", "1") != "0"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Static data is checked against its schemas once, before it is served;
+    # a DatasetError here stops the server from starting. Lazily mounted
+    # routers run their checks when they are mounted, so run
+    # `python -m app.coldstart` before a deploy to check them all.
+    if not LAZY_ROUTERS:
+        app.state.routers.ensure_all()
+    validate_datasets()
+    yield
+    # Give queued contact messages a chance to go out before exiting.
+    contact = app.state.routers.mounted.get("/api/contact")
+    if contact is not None:
+        await contact.OUTBOX.close()
 
 app = FastAPI(
     title="Anil Kumar Ravuri — Portfolio API",
     description="Backend API serving portfolio data and contact form",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS — add your Vercel frontend URL here after deploy
@@ -18,12 +42,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
-app.include_router(profile.router, prefix="/api/profile", tags=["Profile"])
-app.include_router(contact.router, prefix="/api/contact", tags=["Contact"])
-app.include_router(certifications.router, prefix="/api/certifications", tags=["Certifications"])
-app.include_router(blog.router, prefix="/api/blog", tags=["Blog"])
+app.state.routers = LazyRouters(app, {
+    "/api/profile": ("app.routers.profile", ["Profile"]),
+    "/api/contact": ("app.routers.contact", ["Contact"]),
+    "/api/certifications": ("app.routers.certifications", ["Certifications"]),
+    "/api/blog": ("app.routers.blog", ["Blog"]),
+    "/api/batch": ("app.routers.batch", ["Batch"]),
+    "/api/bootstrap": ("app.routers.bootstrap", ["Bootstrap"]),
+    "/api/graph": ("app.routers.graph", ["Graph"]),
+})
+app.add_middleware(LazyRouterMiddleware, routers=app.state.routers)
 
 @app.get("/")
 def root():
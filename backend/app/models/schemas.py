@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
 
 class Skill(BaseModel):
     name: str
@@ -14,6 +14,19 @@ class Experience(BaseModel):
     technologies: List[str]
     responsibilities: List[str]
 
+class SkillUsage(BaseModel):
+    id: str
+    role: str
+    company: str
+    duration: str
+    technologies: List[str]
+    responsibilities: List[str]
+
+class SkillDetail(Skill):
+    slug: str
+    aliases: List[str]
+    experience: List[SkillUsage]
+
 class Education(BaseModel):
     degree: str
     field: str
@@ -52,12 +65,80 @@ class Certification(BaseModel):
     credential_id: Optional[str] = None
     credential_url: Optional[str] = None
 
-class BlogPost(BaseModel):
+class BlogPostSummary(BaseModel):
     slug: str
     title: str
     excerpt: str
-    content: str
     category: str
     date: str
     tags: List[str]
     read_time: int
+
+class BlogPost(BlogPostSummary):
+    content: str
+
+class BlogPostHtml(BlogPostSummary):
+    html: str
+
+class RelatedPost(BlogPostSummary):
+    score: float
+
+class TocEntry(BaseModel):
+    level: int
+    title: str
+    anchor: str
+    offset: int
+    end: int
+    children: List["TocEntry"] = []
+
+class PostToc(BaseModel):
+    slug: str
+    word_count: int
+    read_time: int
+    headings: List[TocEntry]
+
+class PostSection(BaseModel):
+    slug: str
+    index: int
+    count: int
+    title: Optional[str] = None
+    anchor: Optional[str] = None
+    content: str
+
+class SearchHit(BaseModel):
+    slug: str
+    title: str
+    score: float
+    snippet: str
+    offsets: List[List[int]]
+
+class BatchRequest(BaseModel):
+    paths: List[str] = Field(..., min_length=1, max_length=20)
+
+class BatchResult(BaseModel):
+    path: str
+    status: int
+    body: Any
+
+class BatchResponse(BaseModel):
+    results: List[BatchResult]
+
+class Bootstrap(BaseModel):
+    summary: Dict[str, Any]
+    skills: Dict[str, List[str]]
+    certifications: List[Certification]
+    posts: List[BlogPostSummary]
+
+class GraphNode(BaseModel):
+    id: str
+    type: Literal["skill", "tag", "post", "responsibility"]
+    label: str
+
+class GraphEdge(BaseModel):
+    source: str
+    target: str
+    count: int
+
+class ContentGraph(BaseModel):
+    nodes: List[GraphNode]
+    edges: List[GraphEdge]
@@ -0,0 +1,88 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from starlette.routing import Match
+from app.core.payload import encode_json
+from app.models.schemas import BatchRequest, BatchResponse
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+import asyncio
+
+router = APIRouter()
+
+# Route handlers are built once per route (keyed by id, as routes are not
+# hashable) and reused across batches.
+_handlers: Dict[int, object] = {}
+
+
+def resolve(request: Request, path: str) -> Tuple[APIRoute, dict]:
+    """Finds the GET route serving path and the ASGI scope to call it with."""
+    url = urlsplit(path)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "scheme": request.url.scheme,
+        "server": request.scope.get("server"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "headers": [],
+        "app": request.app,
+    }
+    request.app.state.routers.ensure(url.path)
+    for route in request.app.routes:
+        # A GET scope only fully matches routes that accept GET.
+        if isinstance(route, APIRoute):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return route, {**scope, **child_scope}
+    raise LookupError(path)
+
+
+async def run(route: APIRoute, scope: dict) -> Tuple[int, bytes, str]:
+    handler = _handlers.get(id(route))
+    if handler is None:
+        handler = _handlers[id(route)] = route.get_route_handler()
+    try:
+        response = await handler(Request(scope))
+    except HTTPException as e:
+        return e.status_code, encode_json({"detail": e.detail}), "application/json"
+    except RequestValidationError as e:
+        return 422, encode_json({"detail": jsonable_encoder(e.errors())}), "application/json"
+    if hasattr(response, "body"):
+        body = response.body
+    else:
+        body = b"".join([chunk async for chunk in response.body_iterator])
+    return response.status_code, body, response.media_type or ""
+
+
+@router.post("/", response_model=BatchResponse)
+async def batch(request: Request, batch: BatchRequest):
+    """
+    Runs several read-only GET requests in-process, concurrently, and
+    returns every result in one response. Handlers are called directly,
+    without going back through the HTTP stack or middleware. Each result
+    carries its own status code; JSON bodies are embedded as-is.
+    """
+    resolved: List[Tuple[APIRoute, dict]] = []
+    rejected = []
+    for path in batch.paths:
+        try:
+            resolved.append(resolve(request, path))
+        except LookupError:
+            rejected.append(path)
+    if rejected:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "Only read-only GET routes can be batched", "paths": rejected},
+        )
+
+    results = await asyncio.gather(*(run(route, scope) for route, scope in resolved))
+    items = []
+    for path, (status, body, media_type) in zip(batch.paths, results):
+        if not media_type.startswith("application/json"):
+            body = encode_json(body.decode("utf-8"))
+        items.append(b'{"path":' + encode_json(path) + b',"status":' + str(status).encode() + b',"body":' + body + b"}")
+    return Response(content=b'{"results":[' + b",".join(items) + b"]}", media_type="application/json")
@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from app.core.listing import post_date
+from app.core.payload import Payload
+from app.core.routing import StaticRoute
+from app.models.schemas import Bootstrap
+from app.routers import blog, certifications, profile
+
+router = APIRouter(route_class=StaticRoute)
+
+BOOTSTRAP_POSTS = 3
+
+# Everything the first screen renders, in one response. It is spliced
+# together from the already-encoded payloads of the individual endpoints,
+# so it is byte-for-byte consistent with them and costs no extra encoding.
+BOOTSTRAP_PAYLOAD = Payload(
+    b'{"summary":' + profile.SUMMARY_PAYLOAD.body
+    + b',"skills":' + profile.SKILLS_PAYLOAD.body
+    + b',"certifications":' + certifications.CERTIFICATIONS_PAYLOAD.body
+    + b',"posts":' + blog.LISTING_INDEX.page(limit=BOOTSTRAP_POSTS)[0]
+    + b"}",
+    last_modified=max((post_date(p) for p in blog.STORE.posts), default=None),
+).precompress()
+
+
+@router.get("/", response_model=Bootstrap)
+def get_bootstrap():
+    """Returns the profile summary, grouped skills, certifications and latest posts."""
+    return BOOTSTRAP_PAYLOAD.response()
@@ -1,8 +1,11 @@
 from fastapi import APIRouter
+from app.core.datasets import validated
+from app.core.payload import Payload
+from app.core.routing import StaticRoute
 from app.models.schemas import Certification
 from typing import List
 
-router = APIRouter()
+router = APIRouter(route_class=StaticRoute)
 
 CERTIFICATIONS_DATA = [
     {
@@ -32,6 +35,10 @@ CERTIFICATIONS_DATA = [
 ]
 
 
+CERTIFICATIONS = validated("certifications", List[Certification], CERTIFICATIONS_DATA)
+CERTIFICATIONS_PAYLOAD = Payload.json(CERTIFICATIONS).precompress()
+
+
 @router.get("/", response_model=List[Certification])
 def get_certifications():
-    return CERTIFICATIONS_DATA
+    return CERTIFICATIONS_PAYLOAD.response()
@@ -1,35 +1,176 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from app.core.cache import LRUCache
+from app.core.outbox import LogSender, Outbox, SMTPSender
+from app.core.ratelimit import MemoryBucketStore, RateLimit, SQLiteBucketStore
 from app.models.schemas import ContactMessage, ContactResponse
+from email.message import EmailMessage
+from typing import Tuple
+import asyncio
+import hashlib
+import json
 import logging
+import os
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Without SMTP_HOST, messages are only logged.
+SMTP_HOST = os.getenv("SMTP_HOST")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "465" if os.getenv("SMTP_SSL") == "1" else "587"))
+SMTP_USER = os.getenv("SMTP_USER")
+SMTP_PASS = os.getenv("SMTP_PASS")
+SMTP_SSL = os.getenv("SMTP_SSL") == "1"
+CONTACT_TO = os.getenv("CONTACT_TO", "anilkumar80459@gmail.com")
+CONTACT_FROM = os.getenv("CONTACT_FROM", SMTP_USER or "noreply@yourdomain.com")
+
+OUTBOX = Outbox(
+    SMTPSender(SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, use_ssl=SMTP_SSL)
+    if SMTP_HOST else LogSender()
+)
+
+
+# Rate limits are kept per process unless RATE_LIMIT_DB names a SQLite file,
+# which lets every worker on the machine share them.
+RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB")
+RATE_LIMIT_STORE = SQLiteBucketStore(RATE_LIMIT_DB) if RATE_LIMIT_DB else MemoryBucketStore()
+IP_LIMIT = RateLimit(RATE_LIMIT_STORE, capacity=5, period=600)
+EMAIL_LIMIT = RateLimit(RATE_LIMIT_STORE, capacity=3, period=3600)
+
+# Only behind a proxy that sets X-Forwarded-For itself (as Vercel does) is
+# the header the real client address; otherwise anyone could forge it.
+TRUST_FORWARDED_FOR = os.getenv("TRUST_FORWARDED_FOR") == "1"
+
+
+def client_ip(request: Request) -> str:
+    forwarded = request.headers.get("x-forwarded-for")
+    if TRUST_FORWARDED_FOR and forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(request: Request, email) -> None:
+    """Raises 429 once the client address or the sender's email is over its limit."""
+    wait = IP_LIMIT.hit(f"ip:{client_ip(request)}")
+    if not wait and isinstance(email, str) and email.strip():
+        wait = EMAIL_LIMIT.hit(f"email:{email.strip().lower()}")
+    if wait:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many messages. Please try again later.",
+            headers={"Retry-After": str(wait)},
+        )
+
+
+# Answers to recent submissions, so a double click or a client retry gets
+# the same answer again without a second email being queued. Keyed by the
+# message's content hash and, when the client sends one, its Idempotency-Key
+# scoped to the client's address, so clients cannot collide on a key. An
+# entry is dropped again if its message is never delivered.
+SUBMISSIONS = LRUCache(maxsize=1024, ttl=600)
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+def content_hash(raw: dict) -> str:
+    fields = [str(raw.get(name, "")).strip() for name in ("name", "email", "subject", "message")]
+    fields[1] = fields[1].lower()
+    return hashlib.sha256(json.dumps(fields).encode()).hexdigest()
+
+
+async def submission(request: Request) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Returns the submission's content hash and its dedupe keys, read from
+    the raw request before the body is validated. Anything not already
+    answered is rate limited here, so a flood gets 429 before validation,
+    while a duplicate never uses up the sender's allowance.
+    """
+    try:
+        raw = json.loads(await request.body())
+    except ValueError:
+        raw = None
+    if not isinstance(raw, dict):
+        raw = {}
+    digest = content_hash(raw)
+    keys = (f"content:{digest}",)
+
+    idempotency_key = request.headers.get("idempotency-key")
+    if idempotency_key is not None:
+        if not 0 < len(idempotency_key) <= IDEMPOTENCY_KEY_MAX_LENGTH:
+            raise HTTPException(status_code=400, detail="Invalid Idempotency-Key")
+        keys = (f"key:{client_ip(request)}:{idempotency_key}",) + keys
+        previous = SUBMISSIONS.get(keys[0])
+        if previous is not None and previous[0] != digest:
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key was already used for a different message",
+            )
+
+    if all(SUBMISSIONS.get(key) is None for key in keys):
+        # In a thread, as the SQLite store can wait on another worker's lock.
+        await asyncio.to_thread(rate_limit, request, raw.get("email"))
+    return digest, keys
+
+
+def header_text(value: str) -> str:
+    # Header values must not contain line breaks.
+    return " ".join(value.split())
+
+
+def build_email(message: ContactMessage) -> EmailMessage:
+    email = EmailMessage()
+    email["Subject"] = f"Portfolio Contact: {header_text(message.subject)}"
+    email["From"] = CONTACT_FROM
+    email["To"] = CONTACT_TO
+    email["Reply-To"] = header_text(message.email)
+    email.set_content(f"From: {message.name}\nEmail: {message.email}\n\n{message.message}")
+    return email
+
+
 @router.post("/", response_model=ContactResponse)
-async def send_contact(message: ContactMessage):
+async def send_contact(
+    message: ContactMessage,
+    response: Response,
+    submitted: Tuple[str, Tuple[str, ...]] = Depends(submission),
+):
     """
-    Handles contact form submissions.
-    In production: integrate with SendGrid, Resend, or SMTP.
+    Handles contact form submissions. The message is queued in the outbox
+    and the response is sent right away; a background worker delivers it.
+    A repeat of a recent submission, or of an Idempotency-Key, gets the
+    original answer back and queues nothing.
     """
+    digest, keys = submitted
+    for key in keys:
+        previous = SUBMISSIONS.get(key)
+        if previous is not None:
+            for other in keys:
+                SUBMISSIONS.set(other, previous)
+            response.headers["Idempotent-Replayed"] = "true"
+            return previous[1]
+
     try:
-        # Log the message (replace with real email sending in production)
-        logger.info(f"Contact from {message.name} <{message.email}>: {message.subject}")
-
-        # --- Production email (uncomment & configure): ---
-        # import smtplib
-        # from email.mime.text import MIMEText
-        # msg = MIMEText(f"From: {message.name}\nEmail: {message.email}\n\n{message.message}")
-        # msg['Subject'] = f"Portfolio Contact: {message.subject}"
-        # msg['From'] = "noreply@yourdomain.com"
-        # msg['To'] = "anilkumar80459@gmail.com"
-        # with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-        #     server.login(os.getenv("SMTP_USER"), os.getenv("SMTP_PASS"))
-        #     server.send_message(msg)
-
-        return ContactResponse(
-            success=True,
-            message=f"Thanks {message.name}! Your message has been received. I'll get back to you soon."
-        )
-    except Exception as e:
-        logger.error(f"Contact form error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to send message. Please try again.")
+        email = build_email(message)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid message: {e}")
+    answer = ContactResponse(
+        success=True,
+        message=f"Thanks {message.name}! Your message has been received. I'll get back to you soon."
+    )
+    entry = (digest, answer)
+
+    def forget() -> None:
+        # Delivery was given up on, so resubmitting has to queue it again.
+        for key in keys:
+            if SUBMISSIONS.get(key) is entry:
+                SUBMISSIONS.delete(key)
+
+    try:
+        OUTBOX.enqueue(email, on_failure=forget)
+    except asyncio.QueueFull:
+        logger.error("Contact outbox full, rejecting message from %s", message.email)
+        raise HTTPException(status_code=503, detail="Failed to send message. Please try again.")
+    logger.info(f"Contact from {message.name} <{message.email}>: {message.subject}")
+
+    # No await since the lookup above, so a concurrent duplicate cannot
+    # slip in between and queue a second email.
+    for key in keys:
+        SUBMISSIONS.set(key, entry)
+    return answer
@@ -0,0 +1,78 @@
+from fastapi import APIRouter
+from app.core.listing import post_date
+from app.core.matcher import Matcher
+from app.core.payload import Payload
+from app.core.routing import StaticRoute
+from app.models.schemas import ContentGraph
+from app.routers import blog, profile
+from functools import lru_cache
+from typing import Dict, List
+
+router = APIRouter(route_class=StaticRoute)
+
+
+def graph_terms() -> Dict[str, dict]:
+    """Node id -> node for every skill and blog tag, with the phrases that mention it."""
+    terms = {}
+    for slug, skill in profile.SKILL_INDEX.items():
+        terms[f"skill:{slug}"] = {
+            "node": {"id": f"skill:{slug}", "type": "skill", "label": skill["name"]},
+            # The same spellings the skill index matches experience with.
+            "phrases": [skill["name"], *skill["aliases"]],
+        }
+    for post in blog.POST_SUMMARIES.values():
+        for tag in post["tags"]:
+            terms.setdefault(f"tag:{tag.lower()}", {
+                "node": {"id": f"tag:{tag.lower()}", "type": "tag", "label": tag},
+                "phrases": [tag],
+            })
+    return terms
+
+
+def build_graph() -> dict:
+    """
+    Links every skill and tag to the posts and job responsibilities that
+    mention it. All phrases go into one Aho-Corasick matcher, so each text
+    is scanned once however many skills and tags there are, and build time
+    grows with the total amount of text.
+    """
+    terms = graph_terms()
+    matcher = Matcher(
+        (phrase, term_id) for term_id, term in terms.items() for phrase in term["phrases"]
+    )
+
+    nodes: List[dict] = [term["node"] for term in terms.values()]
+    edges: List[dict] = []
+
+    def link(node: dict, text: str) -> None:
+        nodes.append(node)
+        for term_id, count in matcher.count(text).items():
+            edges.append({"source": term_id, "target": node["id"], "count": count})
+
+    # Post bodies are read one at a time through the store's bounded cache.
+    for slug, post in blog.POST_SUMMARIES.items():
+        node = {"id": f"post:{slug}", "type": "post", "label": post["title"]}
+        link(node, post["title"] + "\n" + blog.STORE.body(slug))
+    for job in profile.PROFILE["experience"]:
+        for i, text in enumerate(job["responsibilities"]):
+            node = {"id": f"responsibility:{job['id']}:{i}", "type": "responsibility", "label": text}
+            link(node, text)
+
+    order = {node["id"]: i for i, node in enumerate(nodes)}
+    edges.sort(key=lambda e: (order[e["source"]], order[e["target"]]))
+    return {"nodes": nodes, "edges": edges}
+
+
+@lru_cache(maxsize=None)
+def graph_payload() -> Payload:
+    """Built on the first request, since it has to read every post body."""
+    return Payload.json(
+        build_graph(),
+        last_modified=max((post_date(p) for p in blog.STORE.posts), default=None),
+    ).precompress()
+
+
+@router.get("/", response_model=ContentGraph)
+def get_graph():
+    """Returns the skills and tags, the content that mentions them, and how often."""
+    return graph_payload().response()
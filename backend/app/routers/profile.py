@@ -1,7 +1,15 @@
-from fastapi import APIRouter
-from app.models.schemas import Profile
+from typing import Optional
 
-router = APIRouter()
+from fastapi import APIRouter, HTTPException, Query
+from app.core.cache import LRUCache
+from app.core.datasets import validated
+from app.core.fields import compile_projection, parse_fields
+from app.core.payload import Payload
+from app.core.routing import StaticRoute
+from app.core.skills import build_skill_index, skill_slug
+from app.models.schemas import Profile, SkillDetail
+
+router = APIRouter(route_class=StaticRoute)
 
 PROFILE_DATA = {
     "name": "Anil Kumar Ravuri",
@@ -126,40 +134,123 @@ PROFILE_DATA = {
     ]
 }
 
+# Spellings of a skill in the experience text and blog posts that its
+# name alone does not give away, keyed by skill name.
+SKILL_ALIASES = {
+    "IBM DataPower Gateway": ["DataPower", "IBM DataPower"],
+    "IBM API Connect (APIC)": ["API Connect"],
+    "Multi-Protocol Gateway": ["MPGW"],
+    "Web Service Proxy": ["WSP"],
+    "OAuth 2.0": ["OAuth"],
+    "Mutual TLS": ["mTLS"],
+    "OpenID Connect": ["OIDC"],
+    "Cloud Pak for Integration": ["CP4I"],
+    "Elastic Search": ["Elasticsearch"],
+    "Citrix NetScaler": ["NetScaler"],
+    "IBM DB2": ["DB2"],
+    "DataPower Ops Dashboard": ["DataPower Operations Dashboard"],
+}
+
+# Validated once and frozen; everything below is derived from this copy.
+PROFILE = validated("profile", Profile, PROFILE_DATA)
+
+SUMMARY = {
+    "name": PROFILE["name"],
+    "title": PROFILE["title"],
+    "tagline": PROFILE["tagline"],
+    "email": PROFILE["email"],
+    "phone": PROFILE["phone"],
+    "location": PROFILE["location"],
+    "available": PROFILE["available"],
+    "years_experience": 7,
+    "datapower_versions": "v6 – v10"
+}
+
+SKILLS_GROUPED: dict = {}
+for skill in PROFILE["skills"]:
+    SKILLS_GROUPED.setdefault(skill["category"], []).append(skill["name"])
+
+SKILL_INDEX = build_skill_index(PROFILE["skills"], PROFILE["experience"], SKILL_ALIASES)
+
+# A skill can be looked up by slug, name or alias. Slugs and names are
+# registered first so an alias never shadows another skill's own name.
+SKILL_LOOKUP: dict = {}
+for slug, entry in SKILL_INDEX.items():
+    SKILL_LOOKUP.setdefault(slug, slug)
+    SKILL_LOOKUP.setdefault(entry["name"].lower(), slug)
+for slug, entry in SKILL_INDEX.items():
+    for alias in entry["aliases"]:
+        SKILL_LOOKUP.setdefault(alias.lower(), slug)
+        SKILL_LOOKUP.setdefault(skill_slug(alias), slug)
+
+# Everything here is fixed per deploy, so each response is encoded and
+# compressed once at startup.
+PROFILE_PAYLOAD = Payload.json(PROFILE).precompress()
+SUMMARY_PAYLOAD = Payload.json(SUMMARY).precompress()
+SKILLS_PAYLOAD = Payload.json(SKILLS_GROUPED).precompress()
+SKILLS_BY_CATEGORY = {
+    category.lower(): Payload.json({category: names}).precompress()
+    for category, names in SKILLS_GROUPED.items()
+}
+SKILL_PAYLOADS = {slug: Payload.json(entry).precompress() for slug, entry in SKILL_INDEX.items()}
+EXPERIENCE_PAYLOAD = Payload.json(PROFILE["experience"]).precompress()
+EDUCATION_PAYLOAD = Payload.json(PROFILE["education"]).precompress()
+
+# Sparse fieldset responses, keyed by (endpoint, normalised fields).
+FIELDS_CACHE = LRUCache(maxsize=128)
+
+FIELDS_QUERY = Query(
+    None,
+    max_length=500,
+    description="Comma-separated fields to return; nested fields use dots, e.g. experience.role",
+)
+
+
+def projected(name: str, data, fields: str) -> Payload:
+    key = (name, parse_fields(fields))
+    try:
+        return FIELDS_CACHE.get_or_set(
+            key, lambda: Payload.json(compile_projection(key[1])(data)).precompress()
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/", response_model=Profile)
-def get_profile():
-    """Returns full profile data for Anil Kumar Ravuri."""
-    return PROFILE_DATA
+def get_profile(fields: Optional[str] = FIELDS_QUERY):
+    """Returns full profile data for Anil Kumar Ravuri, or only the requested fields."""
+    if fields is None:
+        return PROFILE_PAYLOAD.response()
+    return projected("profile", PROFILE, fields).response()
 
 @router.get("/summary")
 def get_summary():
     """Returns a lightweight profile summary."""
-    return {
-        "name": PROFILE_DATA["name"],
-        "title": PROFILE_DATA["title"],
-        "tagline": PROFILE_DATA["tagline"],
-        "email": PROFILE_DATA["email"],
-        "phone": PROFILE_DATA["phone"],
-        "location": PROFILE_DATA["location"],
-        "available": PROFILE_DATA["available"],
-        "years_experience": 7,
-        "datapower_versions": "v6 – v10"
-    }
+    return SUMMARY_PAYLOAD.response()
 
 @router.get("/skills")
-def get_skills():
-    """Returns skills grouped by category."""
-    skills = PROFILE_DATA["skills"]
-    grouped: dict = {}
-    for skill in skills:
-        cat = skill["category"]
-        grouped.setdefault(cat, []).append(skill["name"])
-    return grouped
+def get_skills(category: Optional[str] = None):
+    """Returns skills grouped by category, optionally just one category."""
+    if category is None:
+        return SKILLS_PAYLOAD.response()
+    payload = SKILLS_BY_CATEGORY.get(category.lower())
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return payload.response()
+
+@router.get("/skills/{name}", response_model=SkillDetail)
+def get_skill(name: str):
+    """Returns one skill, by slug, name or alias, with the experience that uses it."""
+    slug = SKILL_LOOKUP.get(name.lower()) or SKILL_LOOKUP.get(skill_slug(name))
+    if slug is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    return SKILL_PAYLOADS[slug].response()
 
 @router.get("/experience")
-def get_experience():
-    return PROFILE_DATA["experience"]
+def get_experience(fields: Optional[str] = FIELDS_QUERY):
+    if fields is None:
+        return EXPERIENCE_PAYLOAD.response()
+    return projected("experience", PROFILE["experience"], fields).response()
 
 @router.get("/education")
 def get_education():
-    return PROFILE_DATA["education"]
+    return EDUCATION_PAYLOAD.response()
@@ -0,0 +1,16 @@
+from app.coldstart import cold_start_ms, dataset_errors
+
+# Same budget as the README's `python -m app.coldstart --budget-ms 1500`.
+BUDGET_MS = 1500
+
+
+def test_cold_start_within_budget():
+    import_ms, health_ms = cold_start_ms()
+    assert import_ms + health_ms <= BUDGET_MS, (
+        f"cold start took {import_ms:.0f} ms import + {health_ms:.0f} ms /health, "
+        f"over the {BUDGET_MS} ms budget"
+    )
+
+
+def test_every_dataset_is_valid():
+    assert dataset_errors() == ""
@@ -0,0 +1,76 @@
+import smtplib
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import LRUCache
+from app.core.outbox import LogSender, Outbox
+from app.core.ratelimit import MemoryBucketStore, RateLimit
+from app.main import app
+from app.routers import contact
+
+
+class RefusingSender(LogSender):
+    """Refuses every message for good, like a 550 from the server."""
+
+    def send(self, message):
+        raise smtplib.SMTPRecipientsRefused({message["To"]: (550, b"No such user")})
+
+    def is_permanent(self, error):
+        return True
+
+
+@pytest.fixture
+def client(monkeypatch):
+    store = MemoryBucketStore()
+    monkeypatch.setattr(contact, "SUBMISSIONS", LRUCache(maxsize=64, ttl=600))
+    monkeypatch.setattr(contact, "OUTBOX", Outbox(LogSender()))
+    monkeypatch.setattr(contact, "IP_LIMIT", RateLimit(store, capacity=100, period=600))
+    monkeypatch.setattr(contact, "EMAIL_LIMIT", RateLimit(store, capacity=100, period=600))
+    monkeypatch.setattr(contact, "TRUST_FORWARDED_FOR", True)
+    with TestClient(app) as client:
+        yield client
+
+
+def message(name: str) -> dict:
+    return {
+        "name": name,
+        "email": f"{name.lower()}@example.com",
+        "subject": "Hello there",
+        "message": f"A message from {name}.",
+    }
+
+
+def post(client, body, ip, key=None):
+    headers = {"X-Forwarded-For": ip}
+    if key is not None:
+        headers["Idempotency-Key"] = key
+    return client.post("/api/contact/", json=body, headers=headers)
+
+
+def test_idempotency_keys_are_scoped_to_the_client(client):
+    first = post(client, message("Alice"), "192.0.2.1", key="same-key")
+    second = post(client, message("Bob"), "192.0.2.2", key="same-key")
+    assert second.status_code == 200
+    assert "Idempotent-Replayed" not in second.headers
+    assert "Bob" in second.json()["message"]
+
+    replay = post(client, message("Alice"), "192.0.2.1", key="same-key")
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert replay.json() == first.json()
+    assert post(client, message("Mallory"), "192.0.2.1", key="same-key").status_code == 422
+
+
+def test_resubmitting_works_once_delivery_is_given_up_on(client, monkeypatch):
+    sender = RefusingSender()
+    monkeypatch.setattr(contact, "OUTBOX", Outbox(sender))
+    assert post(client, message("Alice"), "192.0.2.1", key="k").status_code == 200
+    deadline = time.monotonic() + 5
+    while contact.OUTBOX.failed == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert contact.OUTBOX.failed == 1
+
+    again = post(client, message("Alice"), "192.0.2.1", key="k")
+    assert again.status_code == 200
+    assert "Idempotent-Replayed" not in again.headers
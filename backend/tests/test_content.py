@@ -0,0 +1,30 @@
+import pytest
+
+from app.core.content import ContentStore
+
+FRONT_MATTER = '---\ntitle: "A post"\ndate: "2024-05-01"\n---\n'
+
+
+@pytest.mark.parametrize("ending", ["", "\n"])
+def test_body_streams_and_sections_agree(tmp_path, ending):
+    body = "Intro text.\n\n## First\n\nSome words.\n\n## Last\n\nEnds with é"
+    (tmp_path / "post.md").write_text(FRONT_MATTER + body + ending, encoding="utf-8")
+    store = ContentStore(tmp_path)
+
+    assert "".join(store.iter_body("post", chunk_size=4)) == body
+    assert store.section("post", 2).endswith("Ends with é")
+    assert store.body("post") == body
+    # Sliced from the cached body this time, rather than read from disk.
+    assert "".join(store.section("post", i) for i in range(3)) == body
+
+
+@pytest.mark.parametrize("line, title", [
+    ("## Using C#\n", "Using C#"),
+    ("## Closed ##\n", "Closed"),
+    ("### Spaced   ###   \n", "Spaced"),
+    ("# F# and C#  \n", "F# and C#"),
+])
+def test_heading_titles(tmp_path, line, title):
+    (tmp_path / "post.md").write_text(FRONT_MATTER + line + "\nText.\n", encoding="utf-8")
+    heading = ContentStore(tmp_path).outlines["post"]["headings"][0]
+    assert heading["title"] == title
@@ -0,0 +1,47 @@
+import pytest
+
+from app.core.content import ContentStore
+from app.core.datasets import DatasetError, freeze
+from app.models.schemas import BlogPostSummary
+
+
+def test_frozen_data_refuses_changes():
+    data = freeze({"tags": ["a"], "nested": {"x": 1}})
+    assert data["tags"] == ("a",)
+    for change in (
+        lambda: data.__setitem__("x", 1),
+        lambda: data.update(x=1),
+        lambda: data["nested"].pop("x"),
+    ):
+        with pytest.raises(TypeError):
+            change()
+    with pytest.raises(TypeError):
+        data |= {"x": 1}
+    assert data == {"tags": ("a",), "nested": {"x": 1}}
+
+
+def write_post(directory, slug, front_matter, body="Body.\n"):
+    lines = "".join(f"{key}: {value}\n" for key, value in front_matter.items())
+    (directory / f"{slug}.md").write_text(f"---\n{lines}---\n{body}", encoding="utf-8")
+
+
+FRONT_MATTER = {
+    "title": '"A post"',
+    "excerpt": '"Short"',
+    "category": '"Notes"',
+    "date": '"2024-05-01"',
+    "tags": '["a"]',
+}
+
+
+def test_content_store_checks_front_matter_before_sorting(tmp_path):
+    write_post(tmp_path, "good", FRONT_MATTER)
+    write_post(tmp_path, "undated", {k: v for k, v in FRONT_MATTER.items() if k != "date"})
+    with pytest.raises(DatasetError, match="undated.md front matter"):
+        ContentStore(tmp_path, schema=BlogPostSummary)
+
+
+def test_content_store_reports_unreadable_front_matter(tmp_path):
+    write_post(tmp_path, "broken", {**FRONT_MATTER, "title": "not json"})
+    with pytest.raises(DatasetError, match="broken.md"):
+        ContentStore(tmp_path, schema=BlogPostSummary)
@@ -0,0 +1,18 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def posts_linked(graph: dict, node_id: str) -> set:
+    return {
+        e["target"] for e in graph["edges"]
+        if e["source"] == node_id and e["target"].startswith("post:")
+    }
+
+
+def test_skills_link_posts_by_alias():
+    with TestClient(app) as client:
+        graph = client.get("/api/graph/").json()
+    # 12 posts say "DataPower" and 6 write "mTLS" rather than "Mutual TLS".
+    assert len(posts_linked(graph, "skill:ibm-datapower-gateway")) == 12
+    assert len(posts_linked(graph, "skill:mutual-tls")) == 6
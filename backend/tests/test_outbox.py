@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import socketserver
+import threading
+from email.message import EmailMessage
+from typing import List
+
+import pytest
+
+from app.core.outbox import LogSender, Outbox, SMTPSender
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: no TLS, no auth, scripted DATA replies."""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost ready")
+        while True:
+            line = self.rfile.readline().decode().strip()
+            command = line.split(" ", 1)[0].upper()
+            if not line or command == "QUIT":
+                self.reply("221 bye")
+                return
+            if command in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif command in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 ok")
+            elif command == "DATA":
+                self.reply("354 go ahead")
+                while self.rfile.readline() != b".\r\n":
+                    pass
+                server.attempts += 1
+                code = server.data_replies.pop(0) if server.data_replies else 250
+                if code == 250:
+                    server.delivered += 1
+                self.reply(f"{code} {'ok' if code == 250 else 'no'}")
+            else:
+                self.reply("502 not implemented")
+
+
+class SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.connections = 0
+        self.attempts = 0
+        self.delivered = 0
+        self.data_replies: List[int] = []
+
+
+@pytest.fixture
+def smtp_server():
+    server = SMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def message(n: int) -> EmailMessage:
+    email = EmailMessage()
+    email["Subject"] = f"Message {n}"
+    email["From"] = "site@example.com"
+    email["To"] = "me@example.com"
+    email.set_content(f"Body {n}")
+    return email
+
+
+def deliver(server: SMTPServer, count: int) -> Outbox:
+    outbox = Outbox(SMTPSender(*server.server_address), backoff=0.01)
+
+    async def run():
+        for n in range(count):
+            outbox.enqueue(message(n))
+        await outbox.join()
+        await outbox.close()
+
+    asyncio.run(run())
+    return outbox
+
+
+def test_messages_share_one_connection(smtp_server):
+    outbox = deliver(smtp_server, 3)
+    assert (outbox.sent, outbox.failed) == (3, 0)
+    assert smtp_server.delivered == 3
+    assert smtp_server.connections == 1
+
+
+def test_temporary_failure_is_retried_on_the_same_connection(smtp_server):
+    smtp_server.data_replies = [451]
+    outbox = deliver(smtp_server, 1)
+    assert (outbox.sent, outbox.failed) == (1, 0)
+    assert smtp_server.attempts == 2
+    assert smtp_server.connections == 1
+
+
+def test_permanent_failure_is_given_up_on(smtp_server):
+    smtp_server.data_replies = [550]
+    outbox = deliver(smtp_server, 2)
+    assert (outbox.sent, outbox.failed) == (1, 1)
+    assert smtp_server.attempts == 2
+    assert smtp_server.connections == 1
+
+
+def test_log_sender_is_not_reported_as_sent(caplog):
+    outbox = Outbox(LogSender())
+
+    async def run():
+        outbox.enqueue(message(0))
+        await outbox.join()
+        await outbox.close()
+
+    with caplog.at_level(logging.INFO, logger="app.core.outbox"):
+        asyncio.run(run())
+    assert [r.getMessage() for r in caplog.records] == [
+        "Contact message (not sent, SMTP not configured): Message 0"
+    ]
@@ -0,0 +1,69 @@
+from app.core.ratelimit import MemoryBucketStore, RateLimit, SQLiteBucketStore, take_token
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_refills_at_its_rate():
+    bucket, wait = take_token(None, 0, rate=0.5, capacity=2)
+    assert (bucket, wait) == ((1, 0, 2), 0)
+    bucket, wait = take_token(bucket, 0, rate=0.5, capacity=2)
+    assert wait == 0
+    bucket, wait = take_token(bucket, 1, rate=0.5, capacity=2)
+    assert wait == 1  # half a token back after 1 s, a whole one after 2 s
+    bucket, wait = take_token(bucket, 10, rate=0.5, capacity=2)
+    assert wait == 0 and bucket[0] == 1  # never refills past capacity
+
+
+def test_retry_after_rounds_up_to_whole_seconds():
+    clock = Clock()
+    limit = RateLimit(MemoryBucketStore(clock=clock), capacity=3, period=10)
+    assert [limit.hit("ip") for _ in range(3)] == [0, 0, 0]
+    assert limit.hit("ip") == 4  # 3.33 s until the next token
+    clock.now += 3.4
+    assert limit.hit("ip") == 0
+    assert limit.hit("ip") == 4
+
+
+def test_memory_store_evicts_full_buckets_and_caps_keys():
+    clock = Clock()
+    store = MemoryBucketStore(max_keys=3, clock=clock)
+    limit = RateLimit(store, capacity=1, period=10)
+    for key in "abc":
+        limit.hit(key)
+    assert len(store) == 3
+    limit.hit("d")  # over max_keys: the least recently seen key goes
+    assert len(store) == 3
+    assert limit.hit("a") == 0  # "a" was forgotten, so it starts full again
+    clock.now += 10
+    limit.hit("e")  # every other bucket has refilled by now
+    assert len(store) == 1
+
+
+def test_sqlite_stores_on_one_file_share_buckets(tmp_path):
+    clock = Clock()
+    path = str(tmp_path / "ratelimit.db")
+    first = RateLimit(SQLiteBucketStore(path, clock=clock), capacity=2, period=60)
+    second = RateLimit(SQLiteBucketStore(path, clock=clock), capacity=2, period=60)
+    assert first.hit("ip") == 0
+    assert second.hit("ip") == 0
+    assert first.hit("ip") == 30
+    assert second.hit("ip") == 30
+    clock.now += 30
+    assert second.hit("ip") == 0
+    assert first.hit("ip") == 30
+
+
+def test_sqlite_store_prunes_full_buckets(tmp_path):
+    clock = Clock()
+    store = SQLiteBucketStore(str(tmp_path / "ratelimit.db"), prune_every=2, clock=clock)
+    limit = RateLimit(store, capacity=1, period=10)
+    limit.hit("a")
+    clock.now += 10
+    limit.hit("b")  # the second take prunes "a", which has refilled
+    assert len(store) == 1
@@ -0,0 +1,57 @@
+from fastapi.testclient import TestClient
+
+from app.core.skills import build_skill_index
+from app.main import app
+from app.routers import profile
+
+
+def responsibilities(skill: dict) -> list:
+    return [r for job in skill["experience"] for r in job["responsibilities"]]
+
+
+def test_aliases_name_existing_skills():
+    names = {skill["name"] for skill in profile.PROFILE["skills"]}
+    assert set(profile.SKILL_ALIASES) <= names
+
+
+def test_datapower_links_every_responsibility_that_mentions_it():
+    with TestClient(app) as client:
+        skill = client.get("/api/profile/skills/ibm-datapower-gateway").json()
+    mentions = [
+        r for job in profile.PROFILE["experience"] for r in job["responsibilities"]
+        if "datapower" in r.lower()
+    ]
+    assert len(mentions) == 7
+    assert sorted(responsibilities(skill)) == sorted(mentions)
+
+
+def test_mutual_tls_links_by_name_and_abbreviation():
+    with TestClient(app) as client:
+        assert client.get("/api/profile/skills/mtls").json()["slug"] == "mutual-tls"
+        skill = client.get("/api/profile/skills/mutual-tls").json()
+    assert "mTLS" in skill["aliases"]
+    assert [r for r in responsibilities(skill) if "mutual TLS" in r]
+
+
+def test_extra_aliases_match_abbreviations_and_plurals():
+    skills = [
+        {"name": "Web Service Proxy", "category": "API"},
+        {"name": "DataPower Ops Dashboard", "category": "Tools"},
+    ]
+    experience = [{
+        "id": "job", "role": "Engineer", "company": "Co", "duration": "1y",
+        "technologies": [],
+        "responsibilities": [
+            "Configured WSPs and MPGWs.",
+            "Built dashboards via DataPower Operations Dashboard.",
+        ],
+    }]
+    index = build_skill_index(skills, experience, {
+        "Web Service Proxy": ["WSP"],
+        "DataPower Ops Dashboard": ["DataPower Operations Dashboard"],
+    })
+    assert responsibilities(index["web-service-proxy"]) == ["Configured WSPs and MPGWs."]
+    assert responsibilities(index["datapower-ops-dashboard"]) == [
+        "Built dashboards via DataPower Operations Dashboard."
+    ]
+    assert build_skill_index(skills, experience)["web-service-proxy"]["experience"] == []
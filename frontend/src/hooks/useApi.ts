@@ -25,8 +25,12 @@ export const profileApi = {
 };
 
 export const contactApi = {
-  send: (form: ContactForm): Promise<ContactResponse> =>
-    api.post<ContactResponse>('/api/contact/', form).then(r => r.data),
+  // Pass the same idempotencyKey when retrying a submission so the API
+  // answers the retry without sending the message twice.
+  send: (form: ContactForm, idempotencyKey?: string): Promise<ContactResponse> =>
+    api.post<ContactResponse>('/api/contact/', form, {
+      headers: idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : undefined,
+    }).then(r => r.data),
 };
 
 export const certificationsApi = {